@@ -0,0 +1,24 @@
+"""Shared setup for the top-level entry scripts.
+
+Importing this module puts ``backend`` on ``sys.path`` (once per process) so
+the scripts can ``import app``.
+"""
+
+import os
+import sys
+
+BACKEND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+
+if BACKEND_PATH not in sys.path:
+    sys.path.insert(0, BACKEND_PATH)
+
+
+def apply_local_defaults():
+    """Default to a local SQLite database in dry-run and approval mode.
+    
+    Must run before settings are first loaded. Values already set in the
+    environment are kept.
+    """
+    os.environ.setdefault('DATABASE_URL', 'sqlite:///./devsync_sales.db')
+    os.environ.setdefault('DRY_RUN_MODE', 'true')
+    os.environ.setdefault('APPROVAL_MODE', 'true')
@@ -1,5 +1,7 @@
 """Audit logging system with structured logging and sensitive data masking."""
 
+import asyncio
+import atexit
 import logging
 import json
 import re
@@ -7,38 +9,93 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
 
+from sqlalchemy import insert
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 from app.models import AuditLog
 from app.db import get_db_context
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on buffered rows kept for retry while the database is failing
+MAX_PENDING_AUDIT_ROWS = 10_000
+
+# Dict keys whose values are secrets (matched anywhere in the key, any case)
+_SENSITIVE_KEY_RE = re.compile(
+    r'api[_-]?key|auth[_-]?token|password|secret|credential|private[_-]?key|access[_-]?token',
+    re.IGNORECASE
+)
+
+# Emails and phone numbers in free text, matched in a single scan. Emails keep
+# the first 2 chars of the local part and the domain; phones keep the country
+# code and last 4 digits. Compiled with RE2's linear-time automaton when
+# google-re2 is installed (the pattern needs no backtracking features).
+_PII_RE = (re2 or re).compile(
+    r'(?P<local>[a-zA-Z0-9._%+-]+)@(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|\+?(?P<cc>\d{1,3})?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?(?P<last4>\d{4})'
+)
+
+
+def _mask_pii_match(match: "re.Match[str]") -> str:
+    """Replacement for a single _PII_RE match."""
+    domain = match.group('domain')
+    if domain is not None:
+        return f"{match.group('local')[:2]}***@{domain}"
+    return f"+{match.group('cc') or '**'}***{match.group('last4')}"
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to a JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(entry, default=str)
+
+
+def _mask_secret(value: Any) -> str:
+    """Mask a secret value, keeping the first and last 4 chars of long strings."""
+    if isinstance(value, str) and len(value) > 8:
+        return f"{value[:4]}...{value[-4:]}"
+    return "****"
+
 
 class AuditLogger:
-    """Comprehensive audit logging system."""
+    """Comprehensive audit logging system.
+    
+    Database rows are buffered and written in batches by a background flusher
+    task, once AUDIT_BUFFER_SIZE rows are pending or every
+    AUDIT_FLUSH_INTERVAL_MS. The buffer is shared by all instances so one
+    flusher batches rows from every service. Rows from a failed write are
+    requeued for the next flush, and rows still pending at interpreter exit
+    are written synchronously.
+    """
     
-    # Sensitive field patterns to mask
-    SENSITIVE_PATTERNS = [
-        r'api[_-]?key',
-        r'auth[_-]?token',
-        r'password',
-        r'secret',
-        r'credential',
-        r'private[_-]?key',
-        r'access[_-]?token',
-    ]
+    # Rows waiting to be written, shared across instances
+    _pending: List[Dict[str, Any]] = []
+    _flush_wakeup: Optional[asyncio.Event] = None
+    _flusher_task: Optional[asyncio.Task] = None
     
-    # Email/phone patterns to partially mask
-    EMAIL_PATTERN = re.compile(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
-    PHONE_PATTERN = re.compile(r'\+?(\d{1,3})?[-.\s]?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})')
+    # Set once the first instance has configured logging
+    _logging_configured = False
     
     def __init__(self):
         """Initialize audit logger."""
         self.settings = get_settings()
-        self._setup_logging()
+        if not AuditLogger._logging_configured:
+            self._setup_logging()
     
     def _setup_logging(self):
         """Set up structured logging."""
+        AuditLogger._logging_configured = True
         log_level = getattr(logging, self.settings.LOG_LEVEL.upper(), logging.INFO)
         
         # Configure root logger
@@ -49,49 +106,146 @@ class AuditLogger:
         )
     
     def _mask_sensitive_data(self, data: Any) -> Any:
-        """Recursively mask sensitive data in dictionaries, lists, and strings."""
-        if isinstance(data, dict):
-            return {
-                key: self._mask_value(key, value)
-                for key, value in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._mask_sensitive_data(item) for item in data]
-        elif isinstance(data, str):
-            return self._mask_string(data)
-        else:
+        """Mask sensitive data in nested dictionaries, lists, and strings.
+        
+        Values under sensitive keys are replaced outright; everything else is
+        copied, with emails and phones in strings masked. The tree is walked
+        with an explicit stack, so nesting depth costs no Python frames.
+        
+        A flat dict of non-string scalars under non-sensitive keys (campaign
+        counters and the like) has nothing to mask and is returned as is.
+        """
+        if isinstance(data, dict) and not any(
+            isinstance(value, (str, dict, list)) for value in data.values()
+        ) and not any(
+            isinstance(key, str) and _SENSITIVE_KEY_RE.search(key) for key in data
+        ):
             return data
-    
-    def _mask_value(self, key: str, value: Any) -> Any:
-        """Mask value if key matches sensitive pattern."""
-        key_lower = key.lower()
-        
-        # Check if key matches sensitive patterns
-        for pattern in self.SENSITIVE_PATTERNS:
-            if re.search(pattern, key_lower):
-                if isinstance(value, str) and len(value) > 8:
-                    return f"{value[:4]}...{value[-4:]}"
-                else:
-                    return "****"
-        
-        # Recursively mask nested structures
-        return self._mask_sensitive_data(value)
+        
+        root = [data]
+        stack = [(root, 0, data)]
+        
+        while stack:
+            parent, slot, value = stack.pop()
+            
+            if isinstance(value, dict):
+                masked = {}
+                parent[slot] = masked
+                for key, item in value.items():
+                    if isinstance(key, str) and _SENSITIVE_KEY_RE.search(key):
+                        masked[key] = _mask_secret(item)
+                    else:
+                        masked[key] = item
+                        stack.append((masked, key, item))
+            elif isinstance(value, list):
+                masked = list(value)
+                parent[slot] = masked
+                stack.extend((masked, index, item) for index, item in enumerate(value))
+            elif isinstance(value, str):
+                parent[slot] = self._mask_string(value)
+        
+        return root[0]
     
     def _mask_string(self, text: str) -> str:
         """Mask emails and phone numbers in strings."""
-        # Mask emails: show first 2 chars and domain
-        text = self.EMAIL_PATTERN.sub(
-            lambda m: f"{m.group(1)[:2]}***@{m.group(2)}",
-            text
-        )
+        digits = text[1:] if text[:1] == '+' else text
+        if 10 <= len(digits) <= 13 and digits.isascii() and digits.isdecimal():
+            # A bare phone number (the common field value) is masked by slicing,
+            # producing the same result as _mask_pii_match
+            return f"+{digits[:-10] or '**'}***{digits[-4:]}"
+        return _PII_RE.sub(_mask_pii_match, text)
+    
+    def _store(
+        self,
+        log_level: str,
+        component: str,
+        action: str,
+        details: Dict[str, Any],
+        lead_id: Optional[int] = None,
+        user_id: Optional[str] = None
+    ):
+        """Queue an audit row for the background flusher.
         
-        # Mask phone numbers: show country code and last 4 digits
-        text = self.PHONE_PATTERN.sub(
-            lambda m: f"+{m.group(1) or '**'}***{m.group(4)}",
-            text
-        )
+        Outside a running event loop (sync code, worker threads) the row is
+        written immediately, together with anything still pending.
+        """
+        AuditLogger._pending.append({
+            "log_level": log_level,
+            "component": component,
+            "action": action,
+            "lead_id": lead_id,
+            "user_id": user_id,
+            "details": details
+        })
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            AuditLogger.flush_sync()
+            return
+        
+        self._ensure_flusher(loop)
+        if len(AuditLogger._pending) >= self.settings.AUDIT_BUFFER_SIZE:
+            AuditLogger._flush_wakeup.set()
+    
+    def _ensure_flusher(self, loop: asyncio.AbstractEventLoop):
+        """Start the flusher task on the given loop if it isn't running there."""
+        task = AuditLogger._flusher_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            AuditLogger._flush_wakeup = asyncio.Event()
+            AuditLogger._flusher_task = loop.create_task(self._run_flusher())
+    
+    async def _run_flusher(self):
+        """Flush pending rows when the buffer fills or the interval elapses."""
+        wakeup = AuditLogger._flush_wakeup
+        interval = self.settings.AUDIT_FLUSH_INTERVAL_MS / 1000
         
-        return text
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await self.flush()
+    
+    async def flush(self):
+        """Write all pending audit rows in one batch."""
+        rows, AuditLogger._pending = AuditLogger._pending, []
+        if rows and not await asyncio.to_thread(self._write_rows, rows):
+            AuditLogger._requeue(rows)
+    
+    @classmethod
+    def flush_sync(cls):
+        """Write all pending audit rows on the calling thread."""
+        rows, cls._pending = cls._pending, []
+        if rows and not cls._write_rows(rows):
+            cls._requeue(rows)
+    
+    @classmethod
+    def _requeue(cls, rows: List[Dict[str, Any]]):
+        """Put rows from a failed write back ahead of newer ones for the next flush."""
+        pending = rows + cls._pending
+        overflow = len(pending) - MAX_PENDING_AUDIT_ROWS
+        if overflow > 0:
+            logger.error(f"Audit log buffer full, dropping {overflow} oldest rows")
+            pending = pending[overflow:]
+        cls._pending = pending
+    
+    @staticmethod
+    def _write_rows(rows: List[Dict[str, Any]]) -> bool:
+        """Insert audit rows with a single executemany; returns False on failure."""
+        try:
+            with get_db_context() as db:
+                db.execute(insert(AuditLog), rows)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store {len(rows)} audit logs in database: {e}")
+            return False
+    
+    def _emit(self, level: int, log_entry: Dict[str, Any], exc_info: bool = False):
+        """Log an entry as one JSON line, serializing only if the level is enabled."""
+        if logger.isEnabledFor(level):
+            logger.log(level, _dumps(log_entry), exc_info=exc_info)
     
     def _format_log_entry(
         self,
@@ -141,22 +295,17 @@ class AuditLogger:
         )
         
         # Log to stdout
-        logger.info(json.dumps(log_entry))
+        self._emit(logging.INFO, log_entry)
         
         # Store in database
-        try:
-            with get_db_context() as db:
-                audit_log = AuditLog(
-                    log_level="INFO",
-                    component="outreach",
-                    action=f"send_{outreach_type}",
-                    lead_id=lead_id,
-                    user_id=user_id,
-                    details=self._mask_sensitive_data(result)
-                )
-                db.add(audit_log)
-        except Exception as e:
-            logger.error(f"Failed to store audit log in database: {e}")
+        self._store(
+            log_level="INFO",
+            component="outreach",
+            action=f"send_{outreach_type}",
+            lead_id=lead_id,
+            user_id=user_id,
+            details=log_entry["details"]
+        )
     
     async def log_opt_out(
         self,
@@ -184,23 +333,18 @@ class AuditLogger:
             lead_id=lead_id
         )
         
-        logger.warning(json.dumps(log_entry))
+        self._emit(logging.WARNING, log_entry)
         
-        try:
-            with get_db_context() as db:
-                audit_log = AuditLog(
-                    log_level="WARNING",
-                    component="opt_out",
-                    action="opt_out_request",
-                    lead_id=lead_id,
-                    details=self._mask_sensitive_data({
-                        "contact": contact,
-                        "method": method
-                    })
-                )
-                db.add(audit_log)
-        except Exception as e:
-            logger.error(f"Failed to store opt-out audit log: {e}")
+        self._store(
+            log_level="WARNING",
+            component="opt_out",
+            action="opt_out_request",
+            lead_id=lead_id,
+            details=self._mask_sensitive_data({
+                "contact": contact,
+                "method": method
+            })
+        )
     
     async def log_api_call(
         self,
@@ -218,6 +362,12 @@ class AuditLogger:
             result: Result dictionary with status, response, etc.
             lead_id: Optional lead ID if related to a lead
         """
+        # API logs are only stored at debug level; skip masking and
+        # formatting entirely when nothing would be emitted
+        store = self.settings.LOG_LEVEL == "DEBUG"
+        if not store and not logger.isEnabledFor(logging.DEBUG):
+            return
+        
         log_entry = self._format_log_entry(
             log_level="DEBUG",
             component="api",
@@ -226,22 +376,17 @@ class AuditLogger:
             lead_id=lead_id
         )
         
-        logger.debug(json.dumps(log_entry))
+        self._emit(logging.DEBUG, log_entry)
         
         # Only store API logs if debug level
-        if self.settings.LOG_LEVEL == "DEBUG":
-            try:
-                with get_db_context() as db:
-                    audit_log = AuditLog(
-                        log_level="DEBUG",
-                        component="api",
-                        action=f"{service}_{endpoint}",
-                        lead_id=lead_id,
-                        details=self._mask_sensitive_data(result)
-                    )
-                    db.add(audit_log)
-            except Exception as e:
-                logger.error(f"Failed to store API audit log: {e}")
+        if store:
+            self._store(
+                log_level="DEBUG",
+                component="api",
+                action=f"{service}_{endpoint}",
+                lead_id=lead_id,
+                details=log_entry["details"]
+            )
     
     async def log_error(
         self,
@@ -276,21 +421,16 @@ class AuditLogger:
             user_id=user_id
         )
         
-        logger.error(json.dumps(log_entry), exc_info=True)
+        self._emit(logging.ERROR, log_entry, exc_info=True)
         
-        try:
-            with get_db_context() as db:
-                audit_log = AuditLog(
-                    log_level="ERROR",
-                    component=component,
-                    action="error",
-                    lead_id=lead_id,
-                    user_id=user_id,
-                    details=self._mask_sensitive_data(error_details)
-                )
-                db.add(audit_log)
-        except Exception as e:
-            logger.error(f"Failed to store error audit log: {e}")
+        self._store(
+            log_level="ERROR",
+            component=component,
+            action="error",
+            lead_id=lead_id,
+            user_id=user_id,
+            details=log_entry["details"]
+        )
     
     async def log_verification(
         self,
@@ -314,20 +454,15 @@ class AuditLogger:
             lead_id=lead_id
         )
         
-        logger.info(json.dumps(log_entry))
+        self._emit(logging.INFO, log_entry)
         
-        try:
-            with get_db_context() as db:
-                audit_log = AuditLog(
-                    log_level="INFO",
-                    component="verification",
-                    action=f"verify_{verification_type}",
-                    lead_id=lead_id,
-                    details=self._mask_sensitive_data(result)
-                )
-                db.add(audit_log)
-        except Exception as e:
-            logger.error(f"Failed to store verification audit log: {e}")
+        self._store(
+            log_level="INFO",
+            component="verification",
+            action=f"verify_{verification_type}",
+            lead_id=lead_id,
+            details=log_entry["details"]
+        )
     
     async def log_campaign(
         self,
@@ -352,19 +487,14 @@ class AuditLogger:
             details={**details, "campaign_id": campaign_id}
         )
         
-        logger.info(json.dumps(log_entry))
+        self._emit(logging.INFO, log_entry)
         
-        try:
-            with get_db_context() as db:
-                audit_log = AuditLog(
-                    log_level="INFO",
-                    component="campaign",
-                    action=f"{campaign_type}_{action}",
-                    details=self._mask_sensitive_data({**details, "campaign_id": campaign_id})
-                )
-                db.add(audit_log)
-        except Exception as e:
-            logger.error(f"Failed to store campaign audit log: {e}")
+        self._store(
+            log_level="INFO",
+            component="campaign",
+            action=f"{campaign_type}_{action}",
+            details=log_entry["details"]
+        )
     
     async def log_approval(
         self,
@@ -391,21 +521,16 @@ class AuditLogger:
             user_id=user_id
         )
         
-        logger.info(json.dumps(log_entry))
+        self._emit(logging.INFO, log_entry)
         
-        try:
-            with get_db_context() as db:
-                audit_log = AuditLog(
-                    log_level="INFO",
-                    component="approval",
-                    action=action,
-                    lead_id=lead_id,
-                    user_id=user_id,
-                    details={"approval_id": approval_id}
-                )
-                db.add(audit_log)
-        except Exception as e:
-            logger.error(f"Failed to store approval audit log: {e}")
+        self._store(
+            log_level="INFO",
+            component="approval",
+            action=action,
+            lead_id=lead_id,
+            user_id=user_id,
+            details={"approval_id": approval_id}
+        )
     
     async def purge_old_logs(self, retention_days: Optional[int] = None) -> int:
         """
@@ -461,6 +586,9 @@ class AuditLogger:
         Returns:
             List of audit logs
         """
+        # Include rows still waiting in the write buffer
+        await self.flush()
+        
         try:
             with get_db_context() as db:
                 query = db.query(AuditLog)
@@ -485,6 +613,10 @@ class AuditLogger:
             return []
 
 
+# Rows queued on an event loop that closed without calling flush()
+atexit.register(AuditLogger.flush_sync)
+
+
 # Global audit logger instance
 _audit_logger: Optional[AuditLogger] = None
 
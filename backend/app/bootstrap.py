@@ -0,0 +1,55 @@
+"""One-shot startup for scripts that run campaigns outside the API server."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+from app.audit import get_audit_logger
+from app.db import init_db
+from app.http_client import close_http_client
+from app.scheduler import CampaignScheduler, get_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Scheduler returned by the first successful ensure_ready() call
+_ready_scheduler: Optional[CampaignScheduler] = None
+
+
+async def ensure_ready() -> CampaignScheduler:
+    """
+    Initialize the database and scheduler once per process.
+    
+    Later calls (e.g. re-running a script from a REPL) return the same
+    scheduler without re-creating tables.
+    
+    Returns:
+        Ready-to-use CampaignScheduler
+    """
+    global _ready_scheduler
+    if _ready_scheduler is None:
+        logger.info("Bootstrapping database and scheduler")
+        await asyncio.to_thread(init_db)
+        _ready_scheduler = get_scheduler()
+    return _ready_scheduler
+
+
+def run_entries(*entries: Callable[[], Awaitable[None]]):
+    """
+    Run script entry points in order on a single event loop.
+    
+    Pooled clients (the shared HTTP client, provider sessions) stay bound to
+    one loop for the whole batch and are closed once at the end, instead of
+    being rebuilt by a fresh asyncio.run() per script.
+    
+    Args:
+        entries: Async callables taking no arguments
+    """
+    async def _run():
+        try:
+            for entry in entries:
+                await entry()
+        finally:
+            await get_audit_logger().flush()
+            await close_http_client()
+    
+    asyncio.run(_run())
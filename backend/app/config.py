@@ -1,9 +1,15 @@
 """Configuration management with environment variable validation."""
 
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, validator, PostgresDsn
 import os
+import pytz
+
+# Timezone names accepted by pytz (used everywhere schedules are localized),
+# keyed case-insensitively like pytz's own lookup
+_VALID_TIMEZONES = {tz.casefold(): tz for tz in pytz.all_timezones}
 
 
 class Settings(BaseSettings):
@@ -125,6 +131,10 @@ class Settings(BaseSettings):
     # Data Retention
     LOG_RETENTION_DAYS: int = Field(90, description="Days to retain logs")
     
+    # Audit log write batching
+    AUDIT_BUFFER_SIZE: int = Field(256, ge=1, description="Pending audit rows that trigger a flush")
+    AUDIT_FLUSH_INTERVAL_MS: int = Field(200, ge=1, description="Max delay before pending audit rows are written")
+    
     # Do Not Call Registry
     DNC_REGISTRY_FILE: Optional[str] = Field(None, description="Path to DNC registry file")
     
@@ -158,15 +168,14 @@ class Settings(BaseSettings):
     
     @validator("TIMEZONE")
     def validate_timezone(cls, v):
-        """Validate timezone string."""
-        try:
-            import pytz
-            pytz.timezone(v)
-        except Exception:
+        """Validate timezone string and return its canonical name."""
+        canonical = _VALID_TIMEZONES.get(v.casefold())
+        if canonical is None:
             raise ValueError(f"Invalid timezone: {v}")
-        return v
+        return canonical
     
-    def mask_sensitive(self, key: str, value: str) -> str:
+    @staticmethod
+    def mask_sensitive(value: Optional[str]) -> str:
         """Mask sensitive configuration values for logging."""
         if not value:
             return "None"
@@ -186,21 +195,15 @@ class Settings(BaseSettings):
         config = self.model_dump()
         for key in sensitive_keys:
             if key in config and config[key]:
-                config[key] = self.mask_sensitive(key, config[key])
+                config[key] = self.mask_sensitive(config[key])
         
         return config
 
 
-# Global settings instance
-settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create settings instance."""
-    global settings
-    if settings is None:
-        settings = Settings()
-    return settings
+    """Get the settings instance (loaded from the environment once)."""
+    return Settings()
 
 
 def validate_production_config():
@@ -0,0 +1,112 @@
+"""Shared HTTP client for outbound provider calls."""
+
+from typing import Any, Optional
+import asyncio
+import logging
+import random
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_DELAY = 10.0
+
+# Connection pool sizing; idle connections are kept for a minute so bursts
+# of provider calls reuse them instead of reconnecting
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# Global pooled client
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared pooled HTTP client."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+            ),
+            timeout=10.0,
+            http2=h2 is not None
+        )
+        logger.debug("Shared HTTP client created")
+    return _client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def get_with_retry(url: str, max_attempts: int = 3, **kwargs) -> httpx.Response:
+    """
+    GET through the shared client, retrying transient failures.
+    
+    Transport errors, 429 and 5xx responses are retried with exponential
+    backoff and jitter (honouring Retry-After). Waits use asyncio.sleep so
+    other coroutines keep running.
+    
+    Args:
+        url: Request URL
+        max_attempts: Total attempts including the first
+        **kwargs: Passed through to httpx.AsyncClient.get
+        
+    Returns:
+        Last response received (may still be a 429/5xx once attempts run out)
+    """
+    client = get_http_client()
+    
+    for attempt in range(max_attempts):
+        last_attempt = attempt == max_attempts - 1
+        try:
+            response = await client.get(url, **kwargs)
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                return response
+            delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+        
+        await asyncio.sleep(delay)
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Backoff delay for an attempt, preferring a numeric Retry-After."""
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    return min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
@@ -3,10 +3,14 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
 import sys
 
 from app.config import get_settings, validate_production_config
+from app.http_client import close_http_client
+from app.audit import get_audit_logger
 from app import __version__
 
 # Configure logging
@@ -18,6 +22,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Worker threads available to asyncio.to_thread (scraper HTML parsing)
+PARSE_THREAD_POOL_SIZE = 8
+
 # Create FastAPI app
 app = FastAPI(
     title="DevSyncSalesAI",
@@ -42,6 +49,11 @@ async def startup_event():
     """Initialize application on startup."""
     logger.info("Starting DevSyncSalesAI...")
     
+    # Bound the thread pool used for offloaded HTML parsing (asyncio.to_thread)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=PARSE_THREAD_POOL_SIZE)
+    )
+    
     try:
         settings = get_settings()
         logger.info(f"Configuration loaded successfully")
@@ -81,6 +93,8 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on application shutdown."""
     logger.info("Shutting down DevSyncSalesAI...")
+    await get_audit_logger().flush()
+    await close_http_client()
 
 
 @app.get("/")
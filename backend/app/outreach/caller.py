@@ -1,25 +1,39 @@
 """Voice call service with Vonage and Twilio integration."""
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, time, timedelta
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
+import re
 
 from app.config import get_settings
 from app.db import get_db_context
 from app.models import OutreachHistory, Lead, OptOut
 from app.audit import AuditLogger
+from app.verifier.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+_NON_DIGITS_RE = re.compile(r'\D')
+
+# Phones known to be opted out; opt-outs are permanent, so only positive
+# lookups are cached
+OPT_OUT_CACHE_SIZE = 10_000
+OPT_OUT_CACHE_TTL_SECONDS = 300
+
 # Import vonage at module level
 try:
     import vonage
 except ImportError:
     vonage = None
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 
 class CallStatus(str, Enum):
     """Call status enum."""
@@ -51,6 +65,20 @@ class CallIntent(str, Enum):
     UNKNOWN = "unknown"
 
 
+def _compile_intent_patterns(keywords: Dict[CallIntent, List[str]]) -> List[Tuple[CallIntent, "re.Pattern[str]"]]:
+    """Compile each intent's keywords into one whole-word alternation, in dict order.
+
+    Word boundaries keep short keywords such as "no" from matching inside
+    "know" or "another". Uses RE2's linear-time automaton when google-re2 is
+    installed; the escaped alternation is understood by both engines.
+    """
+    engine = re2 or re
+    return [
+        (intent, engine.compile(r'\b(?:' + '|'.join(map(engine.escape, intent_keywords)) + r')\b'))
+        for intent, intent_keywords in keywords.items()
+    ]
+
+
 @dataclass
 class CallResult:
     """Call result data structure."""
@@ -69,23 +97,46 @@ class VoiceCaller:
     
     # Weekdays only (Monday=0, Sunday=6)
     ALLOWED_WEEKDAYS = [0, 1, 2, 3, 4]  # Monday-Friday
+    _ALLOWED_WEEKDAY_MASK = sum(1 << day for day in ALLOWED_WEEKDAYS)
     
-    # Intent detection keywords
+    # Intent detection keywords, matched as whole words and checked in order;
+    # opt-outs and refusals come first so "do not call" and "not interested"
+    # aren't read as interest
     INTENT_KEYWORDS = {
-        CallIntent.INTERESTED: ["yes", "interested", "tell me more", "sounds good", "okay"],
-        CallIntent.NOT_INTERESTED: ["no", "not interested", "no thanks", "not now"],
         CallIntent.REMOVE: ["remove", "stop", "do not call", "don't call", "unsubscribe"],
+        CallIntent.NOT_INTERESTED: ["no", "not interested", "no thanks", "not now"],
         CallIntent.CALL_BACK: ["call back", "later", "another time", "busy now"],
-        CallIntent.TALK_TO_HUMAN: ["human", "person", "representative", "agent", "speak to someone"]
+        CallIntent.TALK_TO_HUMAN: ["human", "person", "representative", "agent", "speak to someone"],
+        CallIntent.INTERESTED: ["yes", "interested", "tell me more", "sounds good", "okay"]
+    }
+    _INTENT_PATTERNS = _compile_intent_patterns(INTENT_KEYWORDS)
+    
+    # Spoken reply for each detected intent
+    INTENT_REPLIES = {
+        CallIntent.INTERESTED: "Great! We'll send you more information by email. Thank you for your time.",
+        CallIntent.NOT_INTERESTED: "No problem. Thank you for your time. Goodbye.",
+        CallIntent.REMOVE: "You have been removed from our calling list. We apologize for any inconvenience. Goodbye.",
+        CallIntent.CALL_BACK: "We'll call back at a better time. Thank you. Goodbye.",
+        CallIntent.TALK_TO_HUMAN: "We'll have someone from our team reach out to you. Thank you. Goodbye."
     }
+    # TwiML for each intent's reply, rendered on first use
+    _intent_twiml: Dict[CallIntent, str] = {}
     
     def __init__(self):
         """Initialize voice caller."""
         self.config = get_settings()
         self.audit = AuditLogger()
+        
+        # Settings read on every call, snapshotted once
+        self._email_from_name = self.config.EMAIL_FROM_NAME
+        self._dry_run = self.config.DRY_RUN_MODE
+        self._twilio_from = self.config.TWILIO_PHONE_NUMBER
+        self._call_window = self._parse_call_window()
+        
         self._twilio_client = None
         self._vonage_client = None
-        self._dnc_registry = set()  # Do Not Call registry
+        self._dnc_registry = set()  # Do Not Call registry, keyed by _dnc_key()
+        self._opted_out_cache = TTLCache(maxsize=OPT_OUT_CACHE_SIZE, ttl=OPT_OUT_CACHE_TTL_SECONDS)
         
         # Determine which provider to use
         self.provider = self._determine_provider()
@@ -110,9 +161,7 @@ class VoiceCaller:
             if os.path.exists(self.config.DNC_REGISTRY_FILE):
                 with open(self.config.DNC_REGISTRY_FILE, 'r') as f:
                     for line in f:
-                        phone = line.strip()
-                        if phone:
-                            self._dnc_registry.add(phone)
+                        self.add_to_dnc_registry(line)
                 logger.info(f"Loaded {len(self._dnc_registry)} numbers from DNC registry")
         except Exception as e:
             logger.error(f"Error loading DNC registry: {e}")
@@ -162,37 +211,54 @@ class VoiceCaller:
             ist = pytz.timezone(self.config.TIMEZONE)
             check_time = datetime.now(ist)
         
-        # Check weekday
-        if check_time.weekday() not in self.ALLOWED_WEEKDAYS:
+        # Check weekday with a single bit test
+        if not (self._ALLOWED_WEEKDAY_MASK >> check_time.weekday()) & 1:
             return False
         
-        # Parse call window times from config
+        # Check time window
+        window_start, window_end = self._call_window
+        return window_start <= check_time.time() <= window_end
+    
+    def _parse_call_window(self) -> Tuple[time, time]:
+        """Parse the configured call window into (start, end) times."""
         try:
             start_hour, start_min = map(int, self.config.CALL_WINDOW_START.split(':'))
             end_hour, end_min = map(int, self.config.CALL_WINDOW_END.split(':'))
-            window_start = time(start_hour, start_min)
-            window_end = time(end_hour, end_min)
+            return time(start_hour, start_min), time(end_hour, end_min)
         except Exception as e:
             logger.error(f"Error parsing call window times: {e}")
             # Fallback to default 11 AM - 5 PM
-            window_start = time(11, 0)
-            window_end = time(17, 0)
+            return time(11, 0), time(17, 0)
+    
+    @staticmethod
+    def _dnc_key(phone: str) -> Optional[str]:
+        """Normalize a phone number to an E.164-style "+digits" string, or None if it has no digits.
         
-        # Check time window
-        current_time = check_time.time()
-        return window_start <= current_time <= window_end
+        Leading zeros are kept, so "0044..." and "44..." stay distinct.
+        """
+        digits = _NON_DIGITS_RE.sub('', phone)
+        return '+' + digits if digits else None
+    
+    def add_to_dnc_registry(self, phone: str):
+        """Add a phone number to the Do Not Call registry."""
+        key = self._dnc_key(phone)
+        if key is not None:
+            self._dnc_registry.add(key)
     
     async def check_dnc_registry(self, phone: str) -> bool:
         """
         Check if phone number is on Do Not Call registry.
         
+        Formatting is ignored, so "+91 98765-43210" matches "+919876543210".
+        
         Args:
             phone: Phone number to check
             
         Returns:
             True if on DNC registry, False otherwise
         """
-        return phone in self._dnc_registry
+        key = self._dnc_key(phone)
+        return key is not None and key in self._dnc_registry
     
     async def check_opt_out(self, phone: str) -> bool:
         """
@@ -204,16 +270,29 @@ class VoiceCaller:
         Returns:
             True if opted out, False otherwise
         """
+        # A negative answer is never cached, so a new opt-out applies at once
+        if phone in self._opted_out_cache:
+            return True
+        
         try:
-            with get_db_context() as db:
-                opt_out = db.query(OptOut).filter(
-                    OptOut.contact_type == "phone",
-                    OptOut.contact_value == phone
-                ).first()
-                return opt_out is not None
+            opted_out = self._query_opt_out(phone)
         except Exception as e:
             logger.error(f"Error checking opt-out: {e}")
             return True  # Fail safe
+        
+        if opted_out:
+            self._opted_out_cache.set(phone, True)
+        return opted_out
+    
+    @staticmethod
+    def _query_opt_out(phone: str) -> bool:
+        """Look up a phone opt-out in the database."""
+        with get_db_context() as db:
+            opt_out = db.query(OptOut).filter(
+                OptOut.contact_type == "phone",
+                OptOut.contact_value == phone
+            ).first()
+            return opt_out is not None
     
     def detect_intent(self, transcript: str) -> CallIntent:
         """
@@ -230,11 +309,10 @@ class VoiceCaller:
         
         transcript_lower = transcript.lower()
         
-        # Check each intent's keywords
-        for intent, keywords in self.INTENT_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in transcript_lower:
-                    return intent
+        # One search per intent, in INTENT_KEYWORDS order
+        for intent, pattern in self._INTENT_PATTERNS:
+            if pattern.search(transcript_lower):
+                return intent
         
         return CallIntent.UNKNOWN
     
@@ -252,7 +330,7 @@ class VoiceCaller:
         category = lead.category or "business"
         
         message = (
-            f"Hello, this is calling from {self.config.EMAIL_FROM_NAME}. "
+            f"Hello, this is calling from {self._email_from_name}. "
             f"We build websites for {category} businesses. "
             f"May I speak with the person who manages your website? "
             f"Please say yes if you're interested, or say remove to opt out."
@@ -278,7 +356,7 @@ class VoiceCaller:
         phone = lead.primary_phone
         
         # Check if dry-run mode
-        if self.config.DRY_RUN_MODE:
+        if self._dry_run:
             logger.info(f"[DRY-RUN] Would call {phone} for lead {lead.id}")
             await self.audit.log_outreach(
                 lead.id,
@@ -412,7 +490,7 @@ class VoiceCaller:
             
             call = client.calls.create(
                 to=phone,
-                from_=self.config.TWILIO_PHONE_NUMBER,
+                from_=self._twilio_from,
                 url=twiml_url,
                 status_callback=f"https://devsyncinnovation.com/call/status",
                 machine_detection="DetectMessageEnd",
@@ -629,55 +707,37 @@ class VoiceCaller:
         Returns:
             TwiML XML string
         """
+        if intent is not None:
+            # Replies don't depend on the lead, so each is rendered once
+            twiml = self._intent_twiml.get(intent)
+            if twiml is None:
+                from twilio.twiml.voice_response import VoiceResponse
+                
+                response = VoiceResponse()
+                reply = self.INTENT_REPLIES.get(intent)
+                if reply is not None:
+                    response.say(reply, voice='Polly.Aditi')
+                twiml = self._intent_twiml[intent] = str(response)
+            return twiml
+        
         from twilio.twiml.voice_response import VoiceResponse, Gather
         
         response = VoiceResponse()
         
-        if intent is None:
-            # Initial greeting
-            intro = self.generate_tts_introduction(lead)
-            
-            gather = Gather(
-                input='speech',
-                timeout=5,
-                action=f'/call/response?lead_id={lead.id}',
-                speech_timeout='auto'
-            )
-            gather.say(intro, voice='Polly.Aditi')
-            response.append(gather)
-            
-            # If no response
-            response.say("Thank you. We'll follow up by email. Goodbye.", voice='Polly.Aditi')
-            
-        elif intent == CallIntent.INTERESTED:
-            response.say(
-                "Great! We'll send you more information by email. Thank you for your time.",
-                voice='Polly.Aditi'
-            )
-            
-        elif intent == CallIntent.NOT_INTERESTED:
-            response.say(
-                "No problem. Thank you for your time. Goodbye.",
-                voice='Polly.Aditi'
-            )
-            
-        elif intent == CallIntent.REMOVE:
-            response.say(
-                "You have been removed from our calling list. We apologize for any inconvenience. Goodbye.",
-                voice='Polly.Aditi'
-            )
-            
-        elif intent == CallIntent.CALL_BACK:
-            response.say(
-                "We'll call back at a better time. Thank you. Goodbye.",
-                voice='Polly.Aditi'
-            )
-            
-        elif intent == CallIntent.TALK_TO_HUMAN:
-            response.say(
-                "We'll have someone from our team reach out to you. Thank you. Goodbye.",
-                voice='Polly.Aditi'
-            )
+        # Initial greeting
+        intro = self.generate_tts_introduction(lead)
+        
+        gather = Gather(
+            input='speech',
+            timeout=5,
+            action=f'/call/response?lead_id={lead.id}',
+            speech_timeout='auto'
+        )
+        gather.say(intro, voice='Polly.Aditi')
+        response.append(gather)
+        
+        # If no response
+        response.say("Thank you. We'll follow up by email. Goodbye.", voice='Polly.Aditi')
         
         return str(response)
     
@@ -1,16 +1,28 @@
 """Base scraper class and utilities."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import asyncio
 import random
+import re
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_LEGAL_SUFFIX_RE = re.compile(
+    r'[\s,]+(private limited|pvt\.? ltd\.?|limited|ltd\.?|inc\.?|llp|llc)$',
+    re.IGNORECASE
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeQuery:
     """Scrape query parameters."""
     location: str
@@ -18,9 +30,13 @@ class ScrapeQuery:
     max_results: int = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class RawLead:
-    """Raw lead data from scraper."""
+    """Raw lead data from scraper.
+    
+    Plain slotted dataclass: scrapers build thousands of these per run, so
+    no per-field validation happens here (Pydantic stays at the API boundary).
+    """
     source: str
     business_name: str
     city: str
@@ -34,6 +50,14 @@ class RawLead:
 class BaseScraper(ABC):
     """Abstract base class for scrapers."""
     
+    # Max in-flight requests per host, shared by scrapers on the same event
+    # loop that use the same limit
+    HOST_CONCURRENCY = 8
+    
+    # Per event loop, so a later asyncio.run() never reuses a dead loop's
+    # semaphores; entries go away with their loop
+    _host_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, int], asyncio.Semaphore]]" = WeakKeyDictionary()
+    
     def __init__(self):
         """Initialize scraper."""
         self.source_name = "unknown"
@@ -48,6 +72,23 @@ class BaseScraper(ABC):
         """Verify scraper can access the source."""
         pass
     
+    @classmethod
+    def get_host_semaphore(cls, host: str, limit: int) -> asyncio.Semaphore:
+        """Get the running loop's semaphore bounding requests to a host at a limit."""
+        loop = asyncio.get_running_loop()
+        semaphores = BaseScraper._host_semaphores.setdefault(loop, {})
+        semaphore = semaphores.get((host, limit))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            semaphores[(host, limit)] = semaphore
+        return semaphore
+    
+    async def _limited_get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """GET a URL while holding the semaphore for its host."""
+        host = urlparse(url).hostname or ""
+        async with self.get_host_semaphore(host, self.HOST_CONCURRENCY):
+            return await client.get(url, **kwargs)
+    
     async def scrape_with_backoff(self, query: ScrapeQuery, max_retries: int = 3) -> List[RawLead]:
         """Scrape with exponential backoff on rate limits."""
         for attempt in range(max_retries):
@@ -74,7 +115,13 @@ class BaseScraper(ABC):
         jitter = random.uniform(0, delay * 0.1)
         return delay + jitter
     
-    def normalize_phone(self, phone: str, country_code: str = "+91") -> str:
+    # Normalizers are pure functions of their input and see the same values
+    # over and over (chain names, shared phone lines), so results are cached
+    # process-wide rather than per scraper instance.
+    
+    @staticmethod
+    @lru_cache(maxsize=10000)
+    def normalize_phone(phone: str, country_code: str = "+91") -> str:
         """Normalize phone to E.164 format."""
         # Remove non-digits
         digits = ''.join(c for c in phone if c.isdigit())
@@ -85,6 +132,19 @@ class BaseScraper(ABC):
         
         return '+' + digits
     
+    @staticmethod
+    @lru_cache(maxsize=10000)
+    def clean_business_name(name: str) -> str:
+        """Strip legal suffixes (Pvt Ltd, Ltd, Inc, ...) and collapse whitespace."""
+        cleaned = _LEGAL_SUFFIX_RE.sub('', name.strip())
+        return ' '.join(cleaned.split())
+    
+    @staticmethod
+    @lru_cache(maxsize=10000)
+    def validate_email(email: str) -> bool:
+        """Check email has a plausible address format."""
+        return bool(_EMAIL_RE.match(email))
+    
     def deduplicate_leads(self, leads: List[RawLead]) -> List[RawLead]:
         """Deduplicate based on (business_name, website, phone)."""
         seen = set()
@@ -13,12 +13,25 @@ logger = logging.getLogger(__name__)
 class GoogleMapsScraper(BaseScraper):
     """Scraper for Google Maps Places API."""
     
+    # Concurrent requests allowed against the Places API
+    HOST_CONCURRENCY = 10
+    
+    # Stable place (Google Sydney) used to probe API access in validate_source
+    VALIDATION_PLACE_ID = "ChIJN1t_tDeuEmsRUsoyG83frY4"
+    
     def __init__(self):
         """Initialize Google Maps scraper."""
         super().__init__("google_maps")
         self.settings = get_settings()
         self.api_key = self.settings.GOOGLE_MAPS_API_KEY
         self.base_url = "https://maps.googleapis.com/maps/api/place"
+        
+        # Only place_id varies between details calls, so build the rest once
+        self._details_url = f"{self.base_url}/details/json"
+        self._details_params = (
+            ("fields", "formatted_phone_number,website,address_components"),
+            ("key", self.api_key),
+        )
     
     async def validate_source(self) -> bool:
         """
@@ -33,11 +46,14 @@ class GoogleMapsScraper(BaseScraper):
         
         try:
             async with httpx.AsyncClient() as client:
-                # Test with a simple query
-                response = await client.get(
-                    f"{self.base_url}/textsearch/json",
+                # Look up a known place asking only for its ID, which is not
+                # billed, instead of spending a text search on a health check
+                response = await self._limited_get(
+                    client,
+                    f"{self.base_url}/details/json",
                     params={
-                        "query": "restaurant",
+                        "place_id": self.VALIDATION_PLACE_ID,
+                        "fields": "place_id",
                         "key": self.api_key
                     },
                     timeout=10.0
@@ -45,7 +61,7 @@ class GoogleMapsScraper(BaseScraper):
                 
                 if response.status_code == 200:
                     data = response.json()
-                    if data.get("status") in ["OK", "ZERO_RESULTS"]:
+                    if data.get("status") in ["OK", "ZERO_RESULTS", "NOT_FOUND"]:
                         return True
                     elif data.get("status") == "REQUEST_DENIED":
                         logger.error(f"Google Maps API access denied: {data.get('error_message')}")
@@ -90,7 +106,8 @@ class GoogleMapsScraper(BaseScraper):
                 
                 # Make request with retry
                 async def make_request():
-                    response = await client.get(
+                    response = await self._limited_get(
+                        client,
                         f"{self.base_url}/textsearch/json",
                         params=params,
                         timeout=30.0
@@ -227,13 +244,10 @@ class GoogleMapsScraper(BaseScraper):
             Place details dictionary
         """
         try:
-            response = await client.get(
-                f"{self.base_url}/details/json",
-                params={
-                    "place_id": place_id,
-                    "fields": "formatted_phone_number,website,address_components",
-                    "key": self.api_key
-                },
+            response = await self._limited_get(
+                client,
+                self._details_url,
+                params=self._details_params + (("place_id", place_id),),
                 timeout=10.0
             )
             
@@ -2,10 +2,11 @@
 
 import httpx
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from robotexclusionrulesparser import RobotExclusionRulesParser
 import logging
 import asyncio
+from collections import deque
 
 from app.scraper.base import BaseScraper, ScrapeQuery, RawLead, RateLimitError, SourceUnavailableError
 
@@ -15,6 +16,15 @@ logger = logging.getLogger(__name__)
 class JustDialScraper(BaseScraper):
     """Scraper for JustDial business directory."""
     
+    # Concurrent requests allowed against JustDial
+    HOST_CONCURRENCY = 4
+    
+    # Search pages requested ahead of the parser
+    PREFETCH_PAGES = 3
+    
+    # Limit to reasonable number of pages
+    MAX_PAGES = 10
+    
     def __init__(self):
         """Initialize JustDial scraper."""
         super().__init__("justdial")
@@ -22,6 +32,11 @@ class JustDialScraper(BaseScraper):
         self.robots_parser = RobotExclusionRulesParser()
         self.user_agent = "DevSyncSalesAI/1.0 (Business Lead Scraper)"
         self.crawl_delay = 2.0  # Default crawl delay
+        self.headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9"
+        }
     
     async def validate_source(self) -> bool:
         """
@@ -33,7 +48,8 @@ class JustDialScraper(BaseScraper):
         try:
             async with httpx.AsyncClient() as client:
                 # Fetch robots.txt
-                response = await client.get(
+                response = await self._limited_get(
+                    client,
                     f"{self.base_url}/robots.txt",
                     headers={"User-Agent": self.user_agent},
                     timeout=10.0
@@ -77,64 +93,55 @@ class JustDialScraper(BaseScraper):
             return []
         
         leads = []
-        page = 1
-        
-        async with httpx.AsyncClient() as client:
-            while len(leads) < query.max_results:
-                # Build search URL
-                search_url = f"{self.base_url}/{query.location}/{query.category}"
-                if page > 1:
-                    search_url += f"/page-{page}"
-                
-                # Respect crawl delay
-                if page > 1:
-                    await asyncio.sleep(self.crawl_delay)
-                
-                # Make request with retry
-                async def make_request():
-                    response = await client.get(
-                        search_url,
-                        headers={
-                            "User-Agent": self.user_agent,
-                            "Accept": "text/html,application/xhtml+xml",
-                            "Accept-Language": "en-US,en;q=0.9"
-                        },
-                        timeout=30.0,
-                        follow_redirects=True
+        loop = asyncio.get_running_loop()
+        
+        async with httpx.AsyncClient(headers=self.headers) as client:
+            # Rolling window of prefetched pages: page N+1's request is in
+            # flight while page N is parsed. Start times stay crawl_delay apart.
+            pending = deque()
+            next_page = 1
+            next_start = loop.time()
+            
+            try:
+                while len(leads) < query.max_results:
+                    while len(pending) < self.PREFETCH_PAGES and next_page <= self.MAX_PAGES:
+                        delay = max(0.0, next_start - loop.time())
+                        task = asyncio.create_task(
+                            self._fetch_page(client, query, next_page, delay)
+                        )
+                        pending.append((next_page, task))
+                        next_start = max(next_start, loop.time()) + self.crawl_delay
+                        next_page += 1
+                    
+                    if not pending:
+                        break
+                    
+                    page, task = pending.popleft()
+                    try:
+                        html = await task
+                    except Exception as e:
+                        logger.error(f"Failed to scrape JustDial page {page}: {e}")
+                        break
+                    
+                    # Parse HTML off the event loop so concurrent fetches keep progressing
+                    page_leads = await asyncio.to_thread(
+                        self._parse_search_results, html, query.location, query.category
                     )
                     
-                    if response.status_code == 429:
-                        raise RateLimitError("JustDial rate limit exceeded")
-                    elif response.status_code >= 500:
-                        raise SourceUnavailableError(f"JustDial error: {response.status_code}")
+                    if not page_leads:
+                        # No more results
+                        break
                     
-                    response.raise_for_status()
-                    return response.text
-                
-                try:
-                    html = await self.retry_with_backoff(make_request)
-                except Exception as e:
-                    logger.error(f"Failed to scrape JustDial page {page}: {e}")
-                    break
-                
-                # Parse HTML
-                page_leads = self._parse_search_results(html, query.location, query.category)
-                
-                if not page_leads:
-                    # No more results
-                    break
-                
-                leads.extend(page_leads)
-                
-                if len(leads) >= query.max_results:
-                    leads = leads[:query.max_results]
-                    break
-                
-                page += 1
-                
-                # Limit to reasonable number of pages
-                if page > 10:
-                    break
+                    leads.extend(page_leads)
+                    
+                    if len(leads) >= query.max_results:
+                        leads = leads[:query.max_results]
+                        break
+            finally:
+                # Stop prefetching once we are done or have hit an error (e.g. 429)
+                for _, task in pending:
+                    task.cancel()
+                await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
         
         # Deduplicate
         unique_leads = self.deduplicate_leads(leads)
@@ -142,6 +149,51 @@ class JustDialScraper(BaseScraper):
         logger.info(f"Scraped {len(unique_leads)} unique leads from JustDial")
         return unique_leads
     
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        query: ScrapeQuery,
+        page: int,
+        delay: float
+    ) -> str:
+        """
+        Fetch a single search results page after waiting for its crawl slot.
+        
+        Args:
+            client: HTTP client
+            query: Scrape query
+            page: Page number (1-based)
+            delay: Seconds to wait before issuing the request
+            
+        Returns:
+            Page HTML
+        """
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        search_url = f"{self.base_url}/{query.location}/{query.category}"
+        if page > 1:
+            search_url += f"/page-{page}"
+        
+        # Make request with retry
+        async def make_request():
+            response = await self._limited_get(
+                client,
+                search_url,
+                timeout=30.0,
+                follow_redirects=True
+            )
+            
+            if response.status_code == 429:
+                raise RateLimitError("JustDial rate limit exceeded")
+            elif response.status_code >= 500:
+                raise SourceUnavailableError(f"JustDial error: {response.status_code}")
+            
+            response.raise_for_status()
+            return response.text
+        
+        return await self.retry_with_backoff(make_request)
+    
     def _parse_search_results(self, html: str, location: str, category: str) -> List[RawLead]:
         """
         Parse search results HTML.
@@ -157,13 +209,13 @@ class JustDialScraper(BaseScraper):
         leads = []
         
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            tree = LexborHTMLParser(html)
             
             # Find business listings (JustDial structure may vary)
             # This is a simplified parser - actual implementation would need
             # to handle JustDial's specific HTML structure
             
-            listings = soup.find_all('li', class_='cntanr')
+            listings = tree.css('li.cntanr')
             
             for listing in listings:
                 try:
@@ -184,7 +236,7 @@ class JustDialScraper(BaseScraper):
         Parse individual business listing.
         
         Args:
-            listing: BeautifulSoup element
+            listing: selectolax node for the listing
             location: Location
             category: Category
             
@@ -193,16 +245,16 @@ class JustDialScraper(BaseScraper):
         """
         try:
             # Extract business name
-            name_elem = listing.find('span', class_='jcn')
+            name_elem = listing.css_first('span.jcn')
             if not name_elem:
                 return None
-            business_name = name_elem.get_text(strip=True)
+            business_name = name_elem.text(strip=True)
             
             # Extract phone numbers
             phone_numbers = []
-            phone_elems = listing.find_all('p', class_='contact-info')
+            phone_elems = listing.css('p.contact-info')
             for elem in phone_elems:
-                phone_text = elem.get_text(strip=True)
+                phone_text = elem.text(strip=True)
                 # Extract numbers from text
                 import re
                 numbers = re.findall(r'[\d\s\-\+\(\)]+', phone_text)
@@ -213,21 +265,21 @@ class JustDialScraper(BaseScraper):
             
             # Extract website
             website = None
-            website_elem = listing.find('a', class_='website')
-            if website_elem and website_elem.get('href'):
-                website = website_elem['href']
+            website_elem = listing.css_first('a.website')
+            if website_elem and website_elem.attributes.get('href'):
+                website = website_elem.attributes['href']
             
             # Extract emails (if available)
             emails = []
-            email_elem = listing.find('a', href=lambda x: x and 'mailto:' in x)
+            email_elem = listing.css_first('a[href*="mailto:"]')
             if email_elem:
-                email = email_elem['href'].replace('mailto:', '')
+                email = email_elem.attributes['href'].replace('mailto:', '')
                 if self.validate_email(email):
                     emails.append(email)
             
             # Extract address for city verification
-            address_elem = listing.find('span', class_='mrehover')
-            address = address_elem.get_text(strip=True) if address_elem else ""
+            address_elem = listing.css_first('span.mrehover')
+            address = address_elem.text(strip=True) if address_elem else ""
             
             return RawLead(
                 source=self.source_name,
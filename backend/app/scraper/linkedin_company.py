@@ -2,7 +2,7 @@
 
 import httpx
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import logging
 import asyncio
 
@@ -14,12 +14,20 @@ logger = logging.getLogger(__name__)
 class LinkedInCompanyScraper(BaseScraper):
     """Scraper for public LinkedIn Company pages."""
     
+    # Concurrent requests allowed against LinkedIn
+    HOST_CONCURRENCY = 2
+    
     def __init__(self):
         """Initialize LinkedIn Company scraper."""
         super().__init__("linkedin_company")
         self.base_url = "https://www.linkedin.com"
         self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         self.crawl_delay = 3.0  # Be respectful with LinkedIn
+        self.headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9"
+        }
     
     async def validate_source(self) -> bool:
         """
@@ -30,7 +38,8 @@ class LinkedInCompanyScraper(BaseScraper):
         """
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.get(
+                response = await self._limited_get(
+                    client,
                     f"{self.base_url}/robots.txt",
                     headers={"User-Agent": self.user_agent},
                     timeout=10.0
@@ -85,19 +94,15 @@ class LinkedInCompanyScraper(BaseScraper):
         """
         logger.info(f"Scraping LinkedIn company: {company_url}")
         
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(headers=self.headers) as client:
             # Respect crawl delay
             await asyncio.sleep(self.crawl_delay)
             
             # Make request
             async def make_request():
-                response = await client.get(
+                response = await self._limited_get(
+                    client,
                     company_url,
-                    headers={
-                        "User-Agent": self.user_agent,
-                        "Accept": "text/html,application/xhtml+xml",
-                        "Accept-Language": "en-US,en;q=0.9"
-                    },
                     timeout=30.0,
                     follow_redirects=True
                 )
@@ -116,8 +121,8 @@ class LinkedInCompanyScraper(BaseScraper):
                 logger.error(f"Failed to scrape LinkedIn company page: {e}")
                 return None
             
-            # Parse company page
-            return self._parse_company_page(html, company_url)
+            # Parse company page off the event loop
+            return await asyncio.to_thread(self._parse_company_page, html, company_url)
     
     def _parse_company_page(self, html: str, url: str) -> Optional[RawLead]:
         """
@@ -131,44 +136,44 @@ class LinkedInCompanyScraper(BaseScraper):
             RawLead or None
         """
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            tree = LexborHTMLParser(html)
             
             # Extract company name
             # LinkedIn's structure varies, this is simplified
-            name_elem = soup.find('h1', class_='org-top-card-summary__title')
+            name_elem = tree.css_first('h1.org-top-card-summary__title')
             if not name_elem:
-                name_elem = soup.find('h1')
+                name_elem = tree.css_first('h1')
             
             if not name_elem:
                 return None
             
-            business_name = name_elem.get_text(strip=True)
+            business_name = name_elem.text(strip=True)
             
             # Extract industry (category)
             category = "business"
-            industry_elem = soup.find('div', class_='org-top-card-summary__info-item')
+            industry_elem = tree.css_first('div.org-top-card-summary__info-item')
             if industry_elem:
-                category = industry_elem.get_text(strip=True)
+                category = industry_elem.text(strip=True)
             
             # Extract location
             city = "Unknown"
-            location_elem = soup.find('div', class_='org-top-card-summary-info-list__info-item')
+            location_elem = tree.css_first('div.org-top-card-summary-info-list__info-item')
             if location_elem:
-                city = location_elem.get_text(strip=True).split(',')[0]
+                city = location_elem.text(strip=True).split(',')[0]
             
             # Extract website
             website = None
-            website_elem = soup.find('a', class_='link-without-visited-state')
-            if website_elem and website_elem.get('href'):
-                website = website_elem['href']
+            website_elem = tree.css_first('a.link-without-visited-state')
+            if website_elem and website_elem.attributes.get('href'):
+                website = website_elem.attributes['href']
             
             # LinkedIn doesn't publicly show phone/email
             phone_numbers = []
             emails = []
             
             # Extract company size and other metadata
-            size_elem = soup.find('dd', class_='org-about-company-module__company-size-definition-text')
-            company_size = size_elem.get_text(strip=True) if size_elem else None
+            size_elem = tree.css_first('dd.org-about-company-module__company-size-definition-text')
+            company_size = size_elem.text(strip=True) if size_elem else None
             
             return RawLead(
                 source=self.source_name,
@@ -0,0 +1,193 @@
+"""Bounded in-process cache for verification results."""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+import time
+import zlib
+
+try:
+    import msgpack
+    import redis.asyncio as redis
+except ImportError:
+    msgpack = None
+    redis = None
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# zlib level 1: most of the size win for a fraction of the CPU of higher levels
+COMPRESSION_LEVEL = 1
+
+
+class TTLCache:
+    """LRU cache with a maximum size and per-entry expiry.
+    
+    Expiry uses time.monotonic() so freshness checks are a float compare and
+    are unaffected by wall-clock changes.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted)
+            ttl: Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a live entry, refreshing its LRU position.
+        
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+            
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            self.misses += 1
+            return default
+        
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store an entry, evicting the least recently used ones over maxsize.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries."""
+        self._data.clear()
+    
+    def __contains__(self, key: str) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and time.monotonic() < entry[0]
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache:
+    """Verification cache shared across workers and restarts via Redis.
+    
+    Redis errors are logged and treated as cache misses so verification keeps
+    working (against the in-memory cache) when Redis is unreachable.
+    
+    Values are stored as zlib-compressed msgpack of the flat dict returned by
+    ``encode``; ``decode`` rebuilds the value from that dict on read.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        prefix: str,
+        encode: Callable[[Any], Dict[str, Any]],
+        decode: Callable[[Dict[str, Any]], Any]
+    ):
+        """
+        Initialize Redis cache.
+        
+        Args:
+            url: Redis connection string
+            prefix: Key namespace, e.g. "emailv:"
+            encode: Converts a value to a msgpack-serializable dict
+            decode: Rebuilds a value from the dict produced by encode
+        """
+        self.prefix = prefix
+        self._encode = encode
+        self._decode = decode
+        self._client = redis.from_url(url)
+    
+    async def get(self, key: str) -> Any:
+        """
+        Get an entry.
+        
+        Args:
+            key: Cache key (without prefix)
+            
+        Returns:
+            Cached value or None
+        """
+        try:
+            raw = await self._client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Redis cache read failed for {self.prefix}{key}: {e}")
+            return None
+        
+        if raw is None:
+            return None
+        
+        try:
+            return self._decode(msgpack.unpackb(zlib.decompress(raw)))
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {self.prefix}{key}: {e}")
+            return None
+    
+    async def set(self, key: str, value: Any, ttl: float):
+        """
+        Store an entry with an expiry.
+        
+        Args:
+            key: Cache key (without prefix)
+            value: Value to store
+            ttl: Time-to-live in seconds
+        """
+        payload = zlib.compress(msgpack.packb(self._encode(value)), COMPRESSION_LEVEL)
+        try:
+            await self._client.setex(self.prefix + key, int(ttl), payload)
+        except Exception as e:
+            logger.warning(f"Redis cache write failed for {self.prefix}{key}: {e}")
+
+
+def get_shared_cache(
+    prefix: str,
+    encode: Callable[[Any], Dict[str, Any]],
+    decode: Callable[[Dict[str, Any]], Any]
+) -> Optional[RedisCache]:
+    """
+    Get a Redis-backed cache if REDIS_URL is configured.
+    
+    Args:
+        prefix: Key namespace
+        encode: Converts a value to a msgpack-serializable dict
+        decode: Rebuilds a value from the dict produced by encode
+        
+    Returns:
+        RedisCache, or None when Redis is not configured or not installed
+    """
+    url = get_settings().REDIS_URL
+    if not url:
+        return None
+    
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis/msgpack packages are not installed")
+        return None
+    
+    return RedisCache(url, prefix, encode, decode)
@@ -1,17 +1,34 @@
 """Email verification using AbstractAPI/ZeroBounce/Hunter."""
 
-import httpx
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Set, Tuple
+from datetime import datetime
 from dataclasses import dataclass
 import logging
+import re
+import asyncio
 
 from app.config import get_settings
+from app.http_client import get_with_retry, parse_json
+from app.verifier.cache import TTLCache, get_shared_cache
 
 logger = logging.getLogger(__name__)
 
+# Verification cache bounds
+CACHE_MAX_SIZE = 10_000
+CACHE_TTL_SECONDS = 30 * 86400
 
-@dataclass
+# Throwaway-inbox domains rejected without a provider call
+DISPOSABLE_DOMAINS = frozenset({
+    'mailinator.com', 'guerrillamail.com', 'guerrillamail.net', '10minutemail.com',
+    'tempmail.com', 'temp-mail.org', 'throwawaymail.com', 'yopmail.com',
+    'getnada.com', 'trashmail.com', 'sharklasers.com', 'dispostable.com',
+    'maildrop.cc', 'fakeinbox.com', 'mailnesia.com', 'mintemail.com'
+})
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@dataclass(slots=True)
 class EmailVerificationResult:
     """Email verification result."""
     email: str
@@ -22,27 +39,64 @@ class EmailVerificationResult:
     verified_at: datetime
 
 
+def _to_cache_fields(result: EmailVerificationResult) -> Dict[str, Any]:
+    """Compact form stored in the shared cache (provider_response is not persisted)."""
+    return {
+        "e": result.email,
+        "d": result.is_deliverable,
+        "b": result.is_business,
+        "c": result.confidence_score,
+        "t": result.verified_at.timestamp()
+    }
+
+
+def _from_cache_fields(fields: Dict[str, Any]) -> EmailVerificationResult:
+    """Rebuild a result from its shared cache form."""
+    return EmailVerificationResult(
+        email=fields["e"],
+        is_deliverable=fields["d"],
+        is_business=fields["b"],
+        confidence_score=fields["c"],
+        provider_response={},
+        verified_at=datetime.fromtimestamp(fields["t"])
+    )
+
+
 class EmailVerifier:
     """Email verification service."""
     
     # Personal email providers to flag
-    PERSONAL_PROVIDERS = [
+    PERSONAL_PROVIDERS = frozenset({
         'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
         'live.com', 'aol.com', 'icloud.com', 'mail.com',
         'protonmail.com', 'yandex.com', 'zoho.com'
-    ]
+    })
     
     # Role-based emails that are acceptable for business
-    BUSINESS_ROLES = [
+    BUSINESS_ROLES = frozenset({
         'info', 'contact', 'sales', 'support', 'admin',
         'hello', 'team', 'office', 'enquiry', 'inquiry'
-    ]
+    })
+    
+    # Single pass substring search over all roles
+    _ROLE_RE = re.compile('|'.join(sorted(BUSINESS_ROLES)))
+    
+    # Providers in order of preference: (name, url, api key setting, parser)
+    PROVIDERS = (
+        ("AbstractAPI", "https://emailvalidation.abstractapi.com/v1/", "ABSTRACTAPI_KEY", "_parse_abstractapi"),
+        ("ZeroBounce", "https://api.zerobounce.net/v2/validate", "ZEROBOUNCE_API_KEY", "_parse_zerobounce"),
+        ("Hunter", "https://api.hunter.io/v2/email-verifier", "HUNTER_API_KEY", "_parse_hunter"),
+    )
     
     def __init__(self):
         """Initialize email verifier."""
         self.settings = get_settings()
-        self.cache: Dict[str, EmailVerificationResult] = {}
-        self.cache_ttl = timedelta(days=30)
+        self.cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS)
+        self.shared_cache = get_shared_cache("emailv:", _to_cache_fields, _from_cache_fields)
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._keep_raw_responses = self.settings.LOG_LEVEL == "DEBUG"
+        self._threshold = self.settings.EMAIL_VERIFICATION_CONFIDENCE_THRESHOLD
     
     async def verify(self, email: str) -> EmailVerificationResult:
         """
@@ -54,192 +108,281 @@ class EmailVerifier:
         Returns:
             EmailVerificationResult
         """
+        # Addresses differing only in case/whitespace share one cache entry
+        key = self._cache_key(email)
+        
         # Check cache first
-        if email in self.cache:
-            cached = self.cache[email]
-            if datetime.utcnow() - cached.verified_at < self.cache_ttl:
-                logger.debug(f"Using cached verification for {email}")
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"Using cached verification for {email}")
+            return cached
+        
+        # Concurrent callers for the same address share one in-flight lookup
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._verify_uncached(email, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+    
+    async def _verify_uncached(self, email: str, key: str) -> EmailVerificationResult:
+        """
+        Verify email after an in-memory cache miss.
+        
+        Args:
+            email: Email address to verify
+            key: Canonical cache key
+            
+        Returns:
+            EmailVerificationResult
+        """
+        if self.shared_cache:
+            cached = await self.shared_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Using shared cached verification for {email}")
+                self.cache.set(key, cached)
                 return cached
         
         # Try providers in order of preference
-        result = None
-        
-        if self.settings.ABSTRACTAPI_KEY:
-            result = await self._verify_with_abstractapi(email)
-        elif self.settings.ZEROBOUNCE_API_KEY:
-            result = await self._verify_with_zerobounce(email)
-        elif self.settings.HUNTER_API_KEY:
-            result = await self._verify_with_hunter(email)
-        else:
-            # Fallback to basic validation
-            result = self._basic_verification(email)
+        result = self._local_reject(email)
+        
+        if result is None:
+            provider = self._configured_provider()
+            if provider:
+                result = await self._verify_with_provider(provider, email)
+            else:
+                # Fallback to basic validation
+                result = self._basic_verification(email)
         
         # Cache result
         if result:
-            self.cache[email] = result
+            self.cache.set(key, result)
+            if self.shared_cache:
+                await self.shared_cache.set(key, result, CACHE_TTL_SECONDS)
         
         return result
     
-    async def _verify_with_abstractapi(self, email: str) -> EmailVerificationResult:
+    def verify_in_background(self, email: str) -> asyncio.Task:
         """
-        Verify email using AbstractAPI.
+        Start verifying an email without waiting for the result.
+        
+        The result lands in the verification caches, so a later verify() for
+        the same address is a cache hit.
         
         Args:
-            email: Email address
+            email: Email address to verify
             
         Returns:
-            EmailVerificationResult
+            Task resolving to the EmailVerificationResult
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://emailvalidation.abstractapi.com/v1/",
-                    params={
-                        "api_key": self.settings.ABSTRACTAPI_KEY,
-                        "email": email
-                    },
-                    timeout=10.0
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse AbstractAPI response
-                is_deliverable = (
-                    data.get("deliverability") == "DELIVERABLE" and
-                    data.get("is_valid_format", {}).get("value", False) and
-                    not data.get("is_disposable_email", {}).get("value", False)
-                )
-                
-                # Check if business email
-                domain = email.split('@')[1].lower() if '@' in email else ''
-                is_business = (
-                    domain not in self.PERSONAL_PROVIDERS or
-                    self._is_role_based_email(email)
-                )
-                
-                # Calculate confidence score
-                confidence = self._calculate_confidence(data, is_deliverable, is_business)
-                
-                return EmailVerificationResult(
-                    email=email,
-                    is_deliverable=is_deliverable,
-                    is_business=is_business,
-                    confidence_score=confidence,
-                    provider_response=data,
-                    verified_at=datetime.utcnow()
-                )
+        task = asyncio.create_task(self.verify(email))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def verify_many(
+        self,
+        emails: List[str],
+        concurrency: int = 20
+    ) -> List[EmailVerificationResult]:
+        """
+        Verify a batch of emails with bounded concurrency.
         
-        except Exception as e:
-            logger.error(f"AbstractAPI verification failed for {email}: {e}")
-            return self._basic_verification(email)
+        Args:
+            emails: Email addresses to verify
+            concurrency: Maximum provider calls in flight
+            
+        Returns:
+            Results in the same order as emails
+        """
+        # Serve cache hits directly; only misses need a provider round-trip
+        results: List[Optional[EmailVerificationResult]] = [
+            self.cache.get(self._cache_key(email)) for email in emails
+        ]
+        misses = [i for i, result in enumerate(results) if result is None]
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def verify_one(email: str) -> EmailVerificationResult:
+            async with semaphore:
+                return await self.verify(email)
+        
+        verified = await asyncio.gather(*(verify_one(emails[i]) for i in misses))
+        for i, result in zip(misses, verified):
+            results[i] = result
+        
+        return results
+    
+    @staticmethod
+    def _cache_key(email: str) -> str:
+        """Canonical cache key for an email address."""
+        return email.strip().lower()
     
-    async def _verify_with_zerobounce(self, email: str) -> EmailVerificationResult:
+    def _configured_provider(self) -> Optional[Tuple[str, str, str, str]]:
         """
-        Verify email using ZeroBounce.
+        Get the first provider (in order of preference) with an API key set.
+        
+        Returns:
+            Provider table entry, or None if no provider is configured
+        """
+        for provider in self.PROVIDERS:
+            if getattr(self.settings, provider[2]):
+                return provider
+        return None
+    
+    async def _verify_with_provider(
+        self,
+        provider: Tuple[str, str, str, str],
+        email: str
+    ) -> EmailVerificationResult:
+        """
+        Verify email with a provider from the PROVIDERS table.
         
         Args:
+            provider: (name, url, api key setting, parser method) entry
             email: Email address
             
         Returns:
-            EmailVerificationResult
+            EmailVerificationResult (basic validation if the provider fails)
         """
+        name, url, key_setting, parser = provider
+        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.zerobounce.net/v2/validate",
-                    params={
-                        "api_key": self.settings.ZEROBOUNCE_API_KEY,
-                        "email": email
-                    },
-                    timeout=10.0
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse ZeroBounce response
-                status = data.get("status", "").lower()
-                is_deliverable = status in ["valid", "catch-all"]
-                
-                # Check if business email
-                domain = email.split('@')[1].lower() if '@' in email else ''
-                is_business = (
-                    domain not in self.PERSONAL_PROVIDERS or
-                    self._is_role_based_email(email)
-                )
-                
-                # Calculate confidence
-                confidence = 0.9 if status == "valid" else 0.6 if status == "catch-all" else 0.0
-                if not is_business:
-                    confidence *= 0.5
-                
-                return EmailVerificationResult(
-                    email=email,
-                    is_deliverable=is_deliverable,
-                    is_business=is_business,
-                    confidence_score=confidence,
-                    provider_response=data,
-                    verified_at=datetime.utcnow()
-                )
+            response = await get_with_retry(
+                url,
+                params={
+                    "api_key": getattr(self.settings, key_setting),
+                    "email": email
+                },
+                timeout=10.0
+            )
+            
+            response.raise_for_status()
+            data = parse_json(response)
+            
+            # Check if business email
+            is_business = self._is_business_email(email)
+            
+            is_deliverable, confidence, facts = getattr(self, parser)(data, is_business)
+            
+            return EmailVerificationResult(
+                email=email,
+                is_deliverable=is_deliverable,
+                is_business=is_business,
+                confidence_score=confidence,
+                # Keep only the fields we read unless debugging; full payloads
+                # are several KB each and live in the cache for days
+                provider_response=data if self._keep_raw_responses else facts,
+                verified_at=datetime.utcnow()
+            )
         
         except Exception as e:
-            logger.error(f"ZeroBounce verification failed for {email}: {e}")
+            logger.error(f"{name} verification failed for {email}: {e}")
             return self._basic_verification(email)
     
-    async def _verify_with_hunter(self, email: str) -> EmailVerificationResult:
+    def _parse_abstractapi(self, data: Dict[str, Any], is_business: bool) -> Tuple[bool, float, Dict[str, Any]]:
         """
-        Verify email using Hunter.io.
+        Parse AbstractAPI response.
         
         Args:
-            email: Email address
+            data: Provider response data
+            is_business: Whether email is business
             
         Returns:
-            EmailVerificationResult
+            Tuple of (is_deliverable, confidence, provider facts)
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.hunter.io/v2/email-verifier",
-                    params={
-                        "api_key": self.settings.HUNTER_API_KEY,
-                        "email": email
-                    },
-                    timeout=10.0
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse Hunter response
-                result = data.get("data", {})
-                status = result.get("status", "").lower()
-                is_deliverable = status in ["valid", "accept_all"]
-                
-                # Check if business email
-                domain = email.split('@')[1].lower() if '@' in email else ''
-                is_business = (
-                    domain not in self.PERSONAL_PROVIDERS or
-                    self._is_role_based_email(email)
-                )
-                
-                # Use Hunter's score
-                confidence = result.get("score", 0) / 100.0
-                if not is_business:
-                    confidence *= 0.5
-                
-                return EmailVerificationResult(
-                    email=email,
-                    is_deliverable=is_deliverable,
-                    is_business=is_business,
-                    confidence_score=confidence,
-                    provider_response=data,
-                    verified_at=datetime.utcnow()
-                )
+        is_deliverable = (
+            data.get("deliverability") == "DELIVERABLE" and
+            data.get("is_valid_format", {}).get("value", False) and
+            not data.get("is_disposable_email", {}).get("value", False)
+        )
         
-        except Exception as e:
-            logger.error(f"Hunter verification failed for {email}: {e}")
+        facts = {
+            "provider": "abstractapi",
+            "deliverability": data.get("deliverability"),
+            "is_valid_format": data.get("is_valid_format", {}).get("value"),
+            "is_disposable_email": data.get("is_disposable_email", {}).get("value"),
+            "is_free_email": data.get("is_free_email", {}).get("value"),
+            "quality_score": data.get("quality_score")
+        }
+        
+        return is_deliverable, self._calculate_confidence(data, is_deliverable, is_business), facts
+    
+    def _parse_zerobounce(self, data: Dict[str, Any], is_business: bool) -> Tuple[bool, float, Dict[str, Any]]:
+        """
+        Parse ZeroBounce response.
+        
+        Args:
+            data: Provider response data
+            is_business: Whether email is business
+            
+        Returns:
+            Tuple of (is_deliverable, confidence, provider facts)
+        """
+        status = data.get("status", "").lower()
+        is_deliverable = status in ["valid", "catch-all"]
+        
+        confidence = 0.9 if status == "valid" else 0.6 if status == "catch-all" else 0.0
+        if not is_business:
+            confidence *= 0.5
+        
+        return is_deliverable, confidence, {"provider": "zerobounce", "status": status}
+    
+    def _parse_hunter(self, data: Dict[str, Any], is_business: bool) -> Tuple[bool, float, Dict[str, Any]]:
+        """
+        Parse Hunter.io response.
+        
+        Args:
+            data: Provider response data
+            is_business: Whether email is business
+            
+        Returns:
+            Tuple of (is_deliverable, confidence, provider facts)
+        """
+        result = data.get("data", {})
+        status = result.get("status", "").lower()
+        is_deliverable = status in ["valid", "accept_all"]
+        
+        # Use Hunter's score
+        confidence = result.get("score", 0) / 100.0
+        if not is_business:
+            confidence *= 0.5
+        
+        return is_deliverable, confidence, {"provider": "hunter", "status": status, "score": result.get("score")}
+    
+    def _local_reject(self, email: str) -> Optional[EmailVerificationResult]:
+        """
+        Reject addresses a provider cannot rescue, without calling one.
+        
+        Malformed and disposable addresses are undeliverable for our purposes;
+        personal (non-role) addresses never pass meets_threshold since it
+        requires a business email, so basic validation is enough for them.
+        
+        Args:
+            email: Email address
+            
+        Returns:
+            EmailVerificationResult, or None if a provider should decide
+        """
+        if not _EMAIL_RE.match(email):
+            reason = "invalid_format"
+        elif email.rpartition('@')[2].lower() in DISPOSABLE_DOMAINS:
+            reason = "disposable_domain"
+        elif not self._is_business_email(email):
             return self._basic_verification(email)
+        else:
+            return None
+        
+        return EmailVerificationResult(
+            email=email,
+            is_deliverable=False,
+            is_business=self._is_business_email(email),
+            confidence_score=0.0,
+            provider_response={"method": "local_reject", "reason": reason},
+            verified_at=datetime.utcnow()
+        )
     
     def _basic_verification(self, email: str) -> EmailVerificationResult:
         """
@@ -251,18 +394,11 @@ class EmailVerifier:
         Returns:
             EmailVerificationResult
         """
-        import re
-        
         # Basic format validation
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        is_valid_format = bool(re.match(pattern, email))
+        is_valid_format = bool(_EMAIL_RE.match(email))
         
         # Check if business email
-        domain = email.split('@')[1].lower() if '@' in email else ''
-        is_business = (
-            domain not in self.PERSONAL_PROVIDERS or
-            self._is_role_based_email(email)
-        )
+        is_business = self._is_business_email(email)
         
         # Low confidence for basic validation
         confidence = 0.5 if is_valid_format and is_business else 0.3
@@ -276,6 +412,19 @@ class EmailVerifier:
             verified_at=datetime.utcnow()
         )
     
+    def _is_business_email(self, email: str) -> bool:
+        """
+        Check if email is a business address (non-personal domain or role-based).
+        
+        Args:
+            email: Email address
+            
+        Returns:
+            True if business email
+        """
+        local_part, _, domain = email.lower().partition('@')
+        return domain not in self.PERSONAL_PROVIDERS or self._ROLE_RE.search(local_part) is not None
+    
     def _is_role_based_email(self, email: str) -> bool:
         """
         Check if email is role-based (acceptable for business).
@@ -287,7 +436,7 @@ class EmailVerifier:
             True if role-based
         """
         local_part = email.split('@')[0].lower() if '@' in email else ''
-        return any(role in local_part for role in self.BUSINESS_ROLES)
+        return self._ROLE_RE.search(local_part) is not None
     
     def _calculate_confidence(
         self,
@@ -338,5 +487,17 @@ class EmailVerifier:
         Returns:
             True if meets threshold
         """
-        threshold = self.settings.EMAIL_VERIFICATION_CONFIDENCE_THRESHOLD
-        return result.confidence_score >= threshold and result.is_deliverable and result.is_business
+        return result.is_deliverable and result.is_business and result.confidence_score >= self._threshold
+    
+    def meets_threshold_batch(self, results: List[EmailVerificationResult]) -> List[bool]:
+        """
+        Check many verification results against the confidence threshold.
+        
+        Args:
+            results: Verification results
+            
+        Returns:
+            One flag per result, in order
+        """
+        threshold = self._threshold
+        return [result.is_deliverable and result.is_business and result.confidence_score >= threshold for result in results]
@@ -1,18 +1,35 @@
 """Phone verification using Twilio Lookup/NumVerify."""
 
-import httpx
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Set, Tuple
+from datetime import datetime
 from dataclasses import dataclass
 import logging
+import re
+import asyncio
 import phonenumbers
 
 from app.config import get_settings
+from app.http_client import get_with_retry, parse_json
+from app.verifier.cache import TTLCache, get_shared_cache
 
 logger = logging.getLogger(__name__)
 
+# Verification cache bounds
+CACHE_MAX_SIZE = 10_000
+CACHE_TTL_SECONDS = 30 * 86400
 
-@dataclass
+_E164_RE = re.compile(r'^\+\d{8,15}$')
+
+# phonenumbers number type -> carrier type
+_NUMBER_TYPE_CARRIERS = {
+    phonenumbers.PhoneNumberType.FIXED_LINE: "landline",
+    phonenumbers.PhoneNumberType.MOBILE: "mobile",
+    phonenumbers.PhoneNumberType.VOIP: "voip",
+    phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: "landline",  # Prefer landline for business
+}
+
+
+@dataclass(slots=True)
 class PhoneVerificationResult:
     """Phone verification result."""
     phone: str
@@ -24,14 +41,50 @@ class PhoneVerificationResult:
     verified_at: datetime
 
 
+def _to_cache_fields(result: PhoneVerificationResult) -> Dict[str, Any]:
+    """Compact form stored in the shared cache (provider_response is not persisted)."""
+    return {
+        "p": result.phone,
+        "v": result.is_valid,
+        "k": result.carrier_type,
+        "b": result.is_business_line,
+        "c": result.confidence_score,
+        "t": result.verified_at.timestamp()
+    }
+
+
+def _from_cache_fields(fields: Dict[str, Any]) -> PhoneVerificationResult:
+    """Rebuild a result from its shared cache form."""
+    return PhoneVerificationResult(
+        phone=fields["p"],
+        is_valid=fields["v"],
+        carrier_type=fields["k"],
+        is_business_line=fields["b"],
+        confidence_score=fields["c"],
+        provider_response={},
+        verified_at=datetime.fromtimestamp(fields["t"])
+    )
+
+
 class PhoneVerifier:
     """Phone verification service."""
     
+    # Providers in order of preference:
+    # (name, required credential settings, request builder, parser)
+    PROVIDERS = (
+        ("Twilio", ("TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN"), "_twilio_request", "_parse_twilio"),
+        ("NumVerify", ("NUMVERIFY_KEY",), "_numverify_request", "_parse_numverify"),
+    )
+    
     def __init__(self):
         """Initialize phone verifier."""
         self.settings = get_settings()
-        self.cache: Dict[str, PhoneVerificationResult] = {}
-        self.cache_ttl = timedelta(days=30)
+        self.cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS)
+        self.shared_cache = get_shared_cache("phonev:", _to_cache_fields, _from_cache_fields)
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._keep_raw_responses = self.settings.LOG_LEVEL == "DEBUG"
+        self._threshold = self.settings.PHONE_VERIFICATION_CONFIDENCE_THRESHOLD
     
     async def verify(self, phone: str, country_code: str = "IN") -> PhoneVerificationResult:
         """
@@ -44,6 +97,13 @@ class PhoneVerifier:
         Returns:
             PhoneVerificationResult
         """
+        # Input already in E.164 is its own cache key; skip parsing on a hit
+        if _E164_RE.match(phone):
+            cached = self.cache.get(phone)
+            if cached is not None:
+                logger.debug(f"Using cached verification for {phone}")
+                return cached
+        
         # Normalize phone first
         try:
             parsed = phonenumbers.parse(phone, country_code)
@@ -52,157 +112,270 @@ class PhoneVerifier:
             logger.debug(f"Failed to parse phone {phone}: {e}")
             return self._invalid_result(phone)
         
+        # Wrong length for its region: invalid without cache or provider lookups
+        if not phonenumbers.is_possible_number(parsed):
+            return self._invalid_result(normalized)
+        
         # Check cache
-        if normalized in self.cache:
-            cached = self.cache[normalized]
-            if datetime.utcnow() - cached.verified_at < self.cache_ttl:
-                logger.debug(f"Using cached verification for {normalized}")
+        cached = self.cache.get(normalized)
+        if cached is not None:
+            logger.debug(f"Using cached verification for {normalized}")
+            return cached
+        
+        # Concurrent callers for the same number share one in-flight lookup
+        task = self._inflight.get(normalized)
+        if task is None:
+            task = asyncio.create_task(self._verify_uncached(normalized, parsed))
+            self._inflight[normalized] = task
+            task.add_done_callback(lambda _: self._inflight.pop(normalized, None))
+        
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+    
+    async def _verify_uncached(
+        self,
+        normalized: str,
+        parsed: phonenumbers.PhoneNumber
+    ) -> PhoneVerificationResult:
+        """
+        Verify phone after an in-memory cache miss.
+        
+        Args:
+            normalized: Phone number in E.164 format (cache key)
+            parsed: Parsed phone number
+            
+        Returns:
+            PhoneVerificationResult
+        """
+        if self.shared_cache:
+            cached = await self.shared_cache.get(normalized)
+            if cached is not None:
+                logger.debug(f"Using shared cached verification for {normalized}")
+                self.cache.set(normalized, cached)
                 return cached
         
         # Try providers in order
-        result = None
-        
-        if self.settings.TWILIO_ACCOUNT_SID and self.settings.TWILIO_AUTH_TOKEN:
-            result = await self._verify_with_twilio(normalized)
-        elif self.settings.NUMVERIFY_KEY:
-            result = await self._verify_with_numverify(normalized)
+        provider = self._configured_provider()
+        if provider:
+            result = await self._verify_with_provider(provider, normalized)
         else:
             # Fallback to basic validation
-            result = self._basic_verification(normalized)
+            result = self._basic_verification(normalized, parsed)
         
         # Cache result
         if result:
-            self.cache[normalized] = result
+            self.cache.set(normalized, result)
+            if self.shared_cache:
+                await self.shared_cache.set(normalized, result, CACHE_TTL_SECONDS)
         
         return result
     
-    async def _verify_with_twilio(self, phone: str) -> PhoneVerificationResult:
+    def verify_in_background(self, phone: str, country_code: str = "IN") -> asyncio.Task:
+        """
+        Start verifying a phone without waiting for the result.
+        
+        The result lands in the verification caches, so a later verify() for
+        the same number is a cache hit.
+        
+        Args:
+            phone: Phone number to verify
+            country_code: ISO country code (default: IN)
+            
+        Returns:
+            Task resolving to the PhoneVerificationResult
+        """
+        task = asyncio.create_task(self.verify(phone, country_code))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def verify_many(
+        self,
+        phones: List[str],
+        country_code: str = "IN",
+        concurrency: int = 20
+    ) -> List[PhoneVerificationResult]:
         """
-        Verify phone using Twilio Lookup API.
+        Verify a batch of phones with bounded concurrency.
         
         Args:
+            phones: Phone numbers to verify
+            country_code: ISO country code (default: IN)
+            concurrency: Maximum provider calls in flight
+            
+        Returns:
+            Results in the same order as phones
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def verify_one(phone: str) -> PhoneVerificationResult:
+            async with semaphore:
+                return await self.verify(phone, country_code)
+        
+        return list(await asyncio.gather(*(verify_one(phone) for phone in phones)))
+    
+    def _configured_provider(self) -> Optional[Tuple[str, Tuple[str, ...], str, str]]:
+        """
+        Get the first provider (in order of preference) with credentials set.
+        
+        Returns:
+            Provider table entry, or None if no provider is configured
+        """
+        for provider in self.PROVIDERS:
+            if all(getattr(self.settings, setting) for setting in provider[1]):
+                return provider
+        return None
+    
+    async def _verify_with_provider(
+        self,
+        provider: Tuple[str, Tuple[str, ...], str, str],
+        phone: str
+    ) -> PhoneVerificationResult:
+        """
+        Verify phone with a provider from the PROVIDERS table.
+        
+        Args:
+            provider: (name, credential settings, request builder, parser) entry
             phone: Phone number in E.164 format
             
         Returns:
-            PhoneVerificationResult
+            PhoneVerificationResult (basic validation if the provider fails)
         """
+        name, _, request_builder, parser = provider
+        
         try:
-            async with httpx.AsyncClient() as client:
-                # Twilio Lookup API
-                url = f"https://lookups.twilio.com/v1/PhoneNumbers/{phone}"
-                
-                response = await client.get(
-                    url,
-                    params={"Type": "carrier"},
-                    auth=(
-                        self.settings.TWILIO_ACCOUNT_SID,
-                        self.settings.TWILIO_AUTH_TOKEN
-                    ),
-                    timeout=10.0
-                )
-                
-                if response.status_code == 404:
-                    # Phone not found
-                    return self._invalid_result(phone)
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse Twilio response
-                carrier = data.get("carrier", {})
-                carrier_type = carrier.get("type", "unknown").lower()
-                
-                # Determine if business line
-                # Landlines and VOIP are more likely business
-                is_business_line = carrier_type in ["landline", "voip"]
-                
-                # Calculate confidence
-                confidence = self._calculate_confidence_twilio(data, carrier_type)
-                
-                return PhoneVerificationResult(
-                    phone=phone,
-                    is_valid=True,
-                    carrier_type=carrier_type,
-                    is_business_line=is_business_line,
-                    confidence_score=confidence,
-                    provider_response=data,
-                    verified_at=datetime.utcnow()
-                )
+            url, request_kwargs = getattr(self, request_builder)(phone)
+            response = await get_with_retry(url, timeout=10.0, **request_kwargs)
+            
+            if response.status_code == 404:
+                # Phone not found
+                return self._invalid_result(phone)
+            
+            response.raise_for_status()
+            data = parse_json(response)
+            
+            return getattr(self, parser)(phone, data)
         
         except Exception as e:
-            logger.error(f"Twilio verification failed for {phone}: {e}")
+            logger.error(f"{name} verification failed for {phone}: {e}")
             return self._basic_verification(phone)
     
-    async def _verify_with_numverify(self, phone: str) -> PhoneVerificationResult:
+    def _twilio_request(self, phone: str) -> Tuple[str, Dict[str, Any]]:
+        """Build Twilio Lookup API request (URL, request kwargs)."""
+        return f"https://lookups.twilio.com/v1/PhoneNumbers/{phone}", {
+            "params": {"Type": "carrier"},
+            "auth": (
+                self.settings.TWILIO_ACCOUNT_SID,
+                self.settings.TWILIO_AUTH_TOKEN
+            )
+        }
+    
+    def _parse_twilio(self, phone: str, data: Dict[str, Any]) -> PhoneVerificationResult:
         """
-        Verify phone using NumVerify API.
+        Parse Twilio Lookup response.
         
         Args:
             phone: Phone number in E.164 format
+            data: Provider response data
             
         Returns:
             PhoneVerificationResult
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "http://apilayer.net/api/validate",
-                    params={
-                        "access_key": self.settings.NUMVERIFY_KEY,
-                        "number": phone,
-                        "format": 1
-                    },
-                    timeout=10.0
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse NumVerify response
-                is_valid = data.get("valid", False)
-                
-                if not is_valid:
-                    return self._invalid_result(phone)
-                
-                # NumVerify provides line_type
-                line_type = data.get("line_type", "unknown").lower()
-                carrier_type = self._map_line_type(line_type)
-                
-                # Determine if business line
-                is_business_line = carrier_type in ["landline", "voip"]
-                
-                # Calculate confidence
-                confidence = 0.8 if is_valid else 0.0
-                if is_business_line:
-                    confidence += 0.1
-                
-                return PhoneVerificationResult(
-                    phone=phone,
-                    is_valid=is_valid,
-                    carrier_type=carrier_type,
-                    is_business_line=is_business_line,
-                    confidence_score=min(confidence, 1.0),
-                    provider_response=data,
-                    verified_at=datetime.utcnow()
-                )
+        carrier = data.get("carrier", {})
+        carrier_type = carrier.get("type", "unknown").lower()
         
-        except Exception as e:
-            logger.error(f"NumVerify verification failed for {phone}: {e}")
-            return self._basic_verification(phone)
+        # Determine if business line
+        # Landlines and VOIP are more likely business
+        is_business_line = carrier_type in ["landline", "voip"]
+        
+        # Calculate confidence
+        confidence = self._calculate_confidence_twilio(data, carrier_type)
+        
+        facts = {"provider": "twilio", "carrier_type": carrier_type, "carrier_name": carrier.get("name")}
+        
+        return PhoneVerificationResult(
+            phone=phone,
+            is_valid=True,
+            carrier_type=carrier_type,
+            is_business_line=is_business_line,
+            confidence_score=confidence,
+            provider_response=data if self._keep_raw_responses else facts,
+            verified_at=datetime.utcnow()
+        )
+    
+    def _numverify_request(self, phone: str) -> Tuple[str, Dict[str, Any]]:
+        """Build NumVerify API request (URL, request kwargs)."""
+        return "http://apilayer.net/api/validate", {
+            "params": {
+                "access_key": self.settings.NUMVERIFY_KEY,
+                "number": phone,
+                "format": 1
+            }
+        }
+    
+    def _parse_numverify(self, phone: str, data: Dict[str, Any]) -> PhoneVerificationResult:
+        """
+        Parse NumVerify response.
+        
+        Args:
+            phone: Phone number in E.164 format
+            data: Provider response data
+            
+        Returns:
+            PhoneVerificationResult
+        """
+        is_valid = data.get("valid", False)
+        
+        if not is_valid:
+            return self._invalid_result(phone)
+        
+        # NumVerify provides line_type
+        line_type = data.get("line_type", "unknown").lower()
+        carrier_type = self._map_line_type(line_type)
+        
+        # Determine if business line
+        is_business_line = carrier_type in ["landline", "voip"]
+        
+        # Calculate confidence
+        confidence = 0.8
+        if is_business_line:
+            confidence += 0.1
+        
+        facts = {"provider": "numverify", "valid": is_valid, "line_type": line_type}
+        
+        return PhoneVerificationResult(
+            phone=phone,
+            is_valid=is_valid,
+            carrier_type=carrier_type,
+            is_business_line=is_business_line,
+            confidence_score=min(confidence, 1.0),
+            provider_response=data if self._keep_raw_responses else facts,
+            verified_at=datetime.utcnow()
+        )
     
-    def _basic_verification(self, phone: str) -> PhoneVerificationResult:
+    def _basic_verification(
+        self,
+        phone: str,
+        parsed: Optional[phonenumbers.PhoneNumber] = None
+    ) -> PhoneVerificationResult:
         """
         Basic phone verification using phonenumbers library.
         
         Args:
             phone: Phone number
+            parsed: Already-parsed number, to skip re-parsing
             
         Returns:
             PhoneVerificationResult
         """
         try:
             # Parse and validate
-            parsed = phonenumbers.parse(phone, None)
+            if parsed is None:
+                parsed = phonenumbers.parse(phone, None)
+            
+            # Cheap length check first; full metadata validation only if possible
+            if not phonenumbers.is_possible_number(parsed):
+                return self._invalid_result(phone)
             is_valid = phonenumbers.is_valid_number(parsed)
             
             # Get number type
@@ -280,16 +453,7 @@ class PhoneVerifier:
         Returns:
             Carrier type string
         """
-        if number_type == phonenumbers.PhoneNumberType.FIXED_LINE:
-            return "landline"
-        elif number_type == phonenumbers.PhoneNumberType.MOBILE:
-            return "mobile"
-        elif number_type == phonenumbers.PhoneNumberType.VOIP:
-            return "voip"
-        elif number_type == phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE:
-            return "landline"  # Prefer landline for business
-        else:
-            return "unknown"
+        return _NUMBER_TYPE_CARRIERS.get(number_type, "unknown")
     
     def _calculate_confidence_twilio(self, data: Dict[str, Any], carrier_type: str) -> float:
         """
@@ -327,5 +491,17 @@ class PhoneVerifier:
         Returns:
             True if meets threshold
         """
-        threshold = self.settings.PHONE_VERIFICATION_CONFIDENCE_THRESHOLD
-        return result.confidence_score >= threshold and result.is_valid
+        return result.is_valid and result.confidence_score >= self._threshold
+    
+    def meets_threshold_batch(self, results: List[PhoneVerificationResult]) -> List[bool]:
+        """
+        Check many verification results against the confidence threshold.
+        
+        Args:
+            results: Verification results
+            
+        Returns:
+            One flag per result, in order
+        """
+        threshold = self._threshold
+        return [result.is_valid and result.confidence_score >= threshold for result in results]
@@ -0,0 +1,16 @@
+"""Hypothesis profiles shared by tests/ and backend/tests/."""
+
+import os
+
+from hypothesis import settings
+
+# Profiles trading coverage for wall time; select with HYPOTHESIS_PROFILE.
+# dev is derandomized so local runs are repeatable and skip the example database.
+settings.register_profile("dev", max_examples=20, deadline=None, derandomize=True)
+settings.register_profile("ci", max_examples=100, deadline=None)
+settings.register_profile("nightly", max_examples=500, deadline=None)
+
+
+def load_profile() -> None:
+    """Load the profile named by HYPOTHESIS_PROFILE (dev by default)."""
+    settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
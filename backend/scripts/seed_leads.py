@@ -73,22 +73,24 @@ def seed_leads():
     ]
     
     with get_db_context() as db:
+        # One query for all existing names instead of one per lead
+        names = [lead_data["business_name"] for lead_data in test_leads]
+        existing = {
+            name for (name,) in db.query(Lead.business_name).filter(Lead.business_name.in_(names))
+        }
+        
+        new_leads = []
         for lead_data in test_leads:
-            # Check if lead already exists
-            existing = db.query(Lead).filter(
-                Lead.business_name == lead_data["business_name"]
-            ).first()
-            
-            if not existing:
-                lead = Lead(**lead_data)
-                db.add(lead)
-                print(f"Added: {lead_data['business_name']}")
-            else:
+            if lead_data["business_name"] in existing:
                 print(f"Skipped (exists): {lead_data['business_name']}")
+            else:
+                new_leads.append(Lead(**lead_data))
+                print(f"Added: {lead_data['business_name']}")
         
+        db.bulk_save_objects(new_leads)
         db.commit()
     
-    print(f"\nSeeding complete! Added {len(test_leads)} test leads.")
+    print(f"\nSeeding complete! Added {len(new_leads)} test leads.")
 
 if __name__ == "__main__":
     seed_leads()
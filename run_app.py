@@ -1,15 +1,9 @@
 """Simple script to run the DevSyncSalesAI application."""
 
-import sys
-import os
-
-# Add backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+import _bootstrap  # puts backend on sys.path
 
 # Set environment variables for local testing
-os.environ.setdefault('DATABASE_URL', 'sqlite:///./devsync_sales.db')
-os.environ.setdefault('DRY_RUN_MODE', 'true')
-os.environ.setdefault('APPROVAL_MODE', 'true')
+_bootstrap.apply_local_defaults()
 
 print("=" * 60)
 print("DevSyncSalesAI - Starting Application")
@@ -17,14 +17,17 @@ NC='\033[0m' # No Color
 # Check if pytest is installed
 if ! command -v pytest &> /dev/null; then
     echo -e "${RED}pytest not found. Installing...${NC}"
-    pip install pytest pytest-asyncio pytest-cov hypothesis
+    pip install pytest pytest-asyncio pytest-cov pytest-xdist hypothesis
 fi
 
+# Full Hypothesis example counts unless a profile is chosen explicitly
+export HYPOTHESIS_PROFILE="${HYPOTHESIS_PROFILE:-ci}"
+
 echo -e "${YELLOW}Running all tests...${NC}"
 echo ""
 
-# Run all tests with coverage
-pytest --cov=app --cov-report=term-missing --cov-report=html -v
+# Run all tests with coverage, spread across one worker per core
+pytest -n auto --cov=app --cov-report=term-missing --cov-report=html -v
 
 TEST_EXIT_CODE=$?
 
@@ -1,14 +1,10 @@
 """Send emails immediately to all eligible businesses."""
 
 import sys
-import os
-import asyncio
 
-# Add backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+import _bootstrap  # noqa: F401  (puts backend on sys.path)
 
-from app.scheduler import get_scheduler
-from app.db import init_db
+from app.bootstrap import ensure_ready, run_entries
 from app.config import get_settings
 
 async def send_emails_now():
@@ -20,19 +16,19 @@ async def send_emails_now():
     
     # Initialize
     print("🔧 Initializing...")
-    init_db()
+    scheduler = await ensure_ready()
     
     settings = get_settings()
-    print(f"📤 Email From: {settings.EMAIL_FROM}")
-    print(f"📧 Daily Cap: {settings.DAILY_EMAIL_CAP}")
-    print(f"🔒 DRY_RUN_MODE: {settings.DRY_RUN_MODE}")
+    email_from, daily_cap, dry_run = settings.EMAIL_FROM, settings.DAILY_EMAIL_CAP, settings.DRY_RUN_MODE
+    print(f"📤 Email From: {email_from}")
+    print(f"📧 Daily Cap: {daily_cap}")
+    print(f"🔒 DRY_RUN_MODE: {dry_run}")
     print()
     
     # Get scheduler and execute campaign
     print("🚀 Starting email campaign...")
     print("-" * 70)
     
-    scheduler = get_scheduler()
     report = await scheduler.execute_email_campaign()
     
     if report:
@@ -66,7 +62,7 @@ async def send_emails_now():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(send_emails_now())
+        run_entries(send_emails_now)
     except KeyboardInterrupt:
         print("\n\n⏹️  Campaign stopped by user")
         sys.exit(0)
@@ -1,19 +1,20 @@
 """Direct test to make call to demo contact."""
 
-import sys
-import os
-import asyncio
 from datetime import datetime
-import pytz
 
-# Add backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+import _bootstrap  # noqa: F401  (puts backend on sys.path)
+
+from sqlalchemy import bindparam, select
 
 from app.db import get_db_context, init_db
 from app.models import Lead
 from app.outreach.caller import get_voice_caller
+from app.bootstrap import run_entries
 from app.config import get_settings
 
+# Built once so SQLAlchemy reuses the compiled statement
+_LEAD_BY_PHONE = select(Lead).where(Lead.primary_phone == bindparam('p'))
+
 async def send_test_call():
     """Make test call to demo contact."""
     print("🔧 Initializing...")
@@ -21,7 +22,8 @@ async def send_test_call():
     
     # Check configuration
     settings = get_settings()
-    print(f"DRY_RUN_MODE: {settings.DRY_RUN_MODE}")
+    dry_run = settings.DRY_RUN_MODE
+    print(f"DRY_RUN_MODE: {dry_run}")
     print()
     
     # Check Vonage
@@ -43,7 +45,8 @@ async def send_test_call():
     print(f"Using Provider: {caller.provider.upper()}")
     print()
     
-    ist = pytz.timezone(settings.TIMEZONE)
+    from zoneinfo import ZoneInfo
+    ist = ZoneInfo(settings.TIMEZONE)
     now = datetime.now(ist)
     
     print(f"Current Time: {now.strftime('%I:%M %p %Z')} ({now.strftime('%A')})")
@@ -54,14 +57,14 @@ async def send_test_call():
     else:
         print("❌ Outside call window")
         print("   Calls can only be made 11 AM - 5 PM IST, Monday-Friday")
-        if not settings.DRY_RUN_MODE:
+        if not dry_run:
             print("   Set DRY_RUN_MODE=true in .env to test outside call window")
             return
     print()
     
     # Get demo contact and keep in session
     with get_db_context() as db:
-        lead = db.query(Lead).filter(Lead.primary_phone == "+917698895249").first()
+        lead = db.scalars(_LEAD_BY_PHONE, {'p': "+917698895249"}).first()
         
         if not lead:
             print("❌ Demo contact not found!")
@@ -97,4 +100,4 @@ async def send_test_call():
             traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(send_test_call())
+    run_entries(send_test_call)
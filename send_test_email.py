@@ -1,18 +1,21 @@
 """Direct test to send email to demo contact."""
 
-import sys
-import os
-import asyncio
+from types import SimpleNamespace
 
-# Add backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+import _bootstrap  # noqa: F401  (puts backend on sys.path)
+
+from sqlalchemy import bindparam, select
 
 from app.db import get_db_context, init_db
 from app.models import Lead
 from app.outreach.personalizer import EmailPersonalizer
 from app.outreach.emailer import EmailSender, OutreachEmail
+from app.bootstrap import run_entries
 from app.config import get_settings
 
+# Built once so SQLAlchemy reuses the compiled statement
+_LEAD_BY_EMAIL = select(Lead).where(Lead.primary_email == bindparam('e'))
+
 async def send_test_email():
     """Send test email to demo contact."""
     print("🔧 Initializing...")
@@ -20,14 +23,15 @@ async def send_test_email():
     
     # Check configuration
     settings = get_settings()
-    print(f"DRY_RUN_MODE: {settings.DRY_RUN_MODE}")
-    print(f"APPROVAL_MODE: {settings.APPROVAL_MODE}")
+    dry_run, approval_mode = settings.DRY_RUN_MODE, settings.APPROVAL_MODE
+    print(f"DRY_RUN_MODE: {dry_run}")
+    print(f"APPROVAL_MODE: {approval_mode}")
     print(f"SendGrid API Key: {'✅ Configured' if settings.SENDGRID_API_KEY else '❌ Missing'}")
     print()
     
     # Get demo contact and extract data
     with get_db_context() as db:
-        lead_obj = db.query(Lead).filter(Lead.primary_email == "anshum25506@gmail.com").first()
+        lead_obj = db.scalars(_LEAD_BY_EMAIL, {'e': "anshum25506@gmail.com"}).first()
         
         if not lead_obj:
             print("❌ Demo contact not found!")
@@ -50,12 +54,7 @@ async def send_test_email():
     
     try:
         # Create a simple Lead-like object for personalization
-        class LeadData:
-            def __init__(self, data):
-                for key, value in data.items():
-                    setattr(self, key, value)
-        
-        lead = LeadData(lead_data)
+        lead = SimpleNamespace(**lead_data)
         
         # Generate personalized content
         print("✍️  Generating personalized content...")
@@ -95,4 +94,4 @@ async def send_test_email():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(send_test_email())
+    run_entries(send_test_email)
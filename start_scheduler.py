@@ -1,24 +1,27 @@
 """Start the scheduler for automatic daily email campaigns."""
 
 import sys
-import os
 
-# Add backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+import _bootstrap  # puts backend on sys.path
+
+# Same local defaults as run_app.py, applied before settings are first loaded
+_bootstrap.apply_local_defaults()
 
 from app.config import get_settings
 
 def main():
     """Start the scheduler."""
     settings = get_settings()
+    email_from, daily_cap = settings.EMAIL_FROM, settings.DAILY_EMAIL_CAP
+    send_time, timezone = settings.EMAIL_SEND_TIME, settings.TIMEZONE
     
     print("=" * 70)
     print("📅 DevSyncSalesAI - Automatic Email Scheduler")
     print("=" * 70)
     print()
-    print(f"⏰ Scheduled Time: {settings.EMAIL_SEND_TIME} {settings.TIMEZONE}")
-    print(f"📧 Daily Email Cap: {settings.DAILY_EMAIL_CAP}")
-    print(f"📤 Email From: {settings.EMAIL_FROM}")
+    print(f"⏰ Scheduled Time: {send_time} {timezone}")
+    print(f"📧 Daily Email Cap: {daily_cap}")
+    print(f"📤 Email From: {email_from}")
     print()
     print("🔄 The scheduler will automatically send emails daily at the scheduled time.")
     print("   Press Ctrl+C to stop the scheduler.")
@@ -26,9 +29,16 @@ def main():
     print("=" * 70)
     print()
     
-    # Start the application with scheduler
-    import subprocess
-    subprocess.run([sys.executable, "run_app.py"])
+    # Start the application with scheduler in this process (no reloader,
+    # which would spawn and re-import everything in a child process)
+    import uvicorn
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=False,
+        log_level="info"
+    )
 
 
 if __name__ == "__main__":
@@ -7,6 +7,11 @@ import asyncio
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from app.scheduler import get_scheduler
 from app.db import init_db
 
@@ -39,4 +44,7 @@ async def test_campaign():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # uvloop ships with uvicorn[standard] on Linux; fall back to asyncio's loop
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(test_campaign())
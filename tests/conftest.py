@@ -1,27 +1,53 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+import asyncio
 import os
 import sys
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Add backend to path
 backend_path = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_path))
 
 from app.config import Settings, get_settings
+from app import db as db_module
 from app.db import Base, get_engine, get_session_factory
 from app.models import Lead, OptOut, OutreachHistory, Campaign
+from hypothesis_profiles import load_profile
+
+TEST_DB_URL = "sqlite+pysqlite:///file:memdb_test?mode=memory&cache=shared&uri=true"
+TEMPLATE_DB_URL = "sqlite+pysqlite:///file:memdb_template?mode=memory&cache=shared&uri=true"
+
+# Per-connection tuning; journal and mmap PRAGMAs (WAL, mmap_size) have no
+# effect on in-memory databases, so only the cache settings are applied
+SQLITE_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
 
 # Set test environment variables
-os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+os.environ["DATABASE_URL"] = TEST_DB_URL
 os.environ["EMAIL_FROM"] = "test@example.com"
 os.environ["BUSINESS_ADDRESS"] = "123 Test Street, Test City, TC 12345"
 os.environ["DRY_RUN_MODE"] = "true"
 os.environ["APPROVAL_MODE"] = "true"
 
+# Hypothesis profiles (dev/ci/nightly) live in backend/hypothesis_profiles.py
+# so both test suites share them; select with HYPOTHESIS_PROFILE
+load_profile()
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Create one event loop shared by all async tests in the session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
 
 @pytest.fixture(scope="session")
 def test_settings():
@@ -29,24 +55,84 @@ def test_settings():
     return get_settings()
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Provide test database session with clean state."""
-    # Create test database engine
-    engine = create_engine("sqlite:///./test.db", connect_args={"check_same_thread": False})
+def _memory_engine(url):
+    """Create an engine holding a single connection to an in-memory database."""
+    # StaticPool keeps the one connection, and with it the database, alive
+    engine = create_engine(
+        url,
+        connect_args={"uri": True, "check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        # Leave BEGIN to SQLAlchemy (below) so SAVEPOINTs nest inside it
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+    
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
     
-    # Create all tables
+    return engine
+
+
+# The app and the tests share one in-memory database; installing the engine
+# up front keeps get_engine() from building a pooled engine of its own
+test_engine = _memory_engine(TEST_DB_URL)
+db_module._engine = test_engine
+
+
+@pytest.fixture(scope="session")
+def template_db():
+    """Create the schema once in an in-memory template database."""
+    engine = _memory_engine(TEMPLATE_DB_URL)
     Base.metadata.create_all(bind=engine)
     
+    yield engine
+    
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(template_db):
+    """Provide test database session with clean state."""
+    # Overwrite the shared database with the empty template instead of re-running DDL
+    with template_db.connect() as source, test_engine.connect() as target:
+        source.connection.driver_connection.backup(target.connection.driver_connection)
+    
     # Create session
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
     
     yield TestingSessionLocal
+
+
+@pytest.fixture(scope="function")
+def db_session(test_db):
+    """Provide a session whose changes are rolled back at teardown.
+    
+    App code using get_db_context() joins the same transaction through
+    savepoints, so its commits are discarded along with the test's.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    
+    session_factory = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
+    previous_factory = db_module._SessionLocal
+    db_module._SessionLocal = session_factory
+    session = session_factory()
     
-    # Clean up
-    Base.metadata.drop_all(bind=engine)
+    yield session
     
-    # Remove test database file
-    import os
-    if os.path.exists("./test.db"):
-        os.remove("./test.db")
+    session.close()
+    db_module._SessionLocal = previous_factory
+    transaction.rollback()
+    connection.close()
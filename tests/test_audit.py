@@ -4,24 +4,51 @@ Feature: devsync-sales-ai
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume
 import re
 from datetime import datetime
 
 from app.audit import AuditLogger, get_audit_logger
 
 
+# Strategies are built once at import; example counts come from the
+# Hypothesis profile selected in conftest.py
+API_KEY_STRATEGY = st.text(
+    min_size=16, max_size=64, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))
+)
+SENSITIVE_KEY_NAME_STRATEGY = st.sampled_from([
+    "api_key", "API_KEY", "auth_token", "AUTH-TOKEN",
+    "password", "PASSWORD", "secret", "SECRET",
+    "sendgrid_api_key", "twilio_auth_token", "openai_api_key"
+])
+INDIAN_PHONE_STRATEGY = st.from_regex(r"\+91[6-9]\d{9}", fullmatch=True)
+SENSITIVE_DICT_STRATEGY = st.dictionaries(
+    keys=st.sampled_from(["api_key", "normal_field", "password", "data"]),
+    values=st.one_of(
+        st.text(min_size=1, max_size=50),
+        st.integers(),
+        st.booleans(),
+        st.dictionaries(
+            keys=st.text(min_size=1, max_size=20),
+            values=st.text(min_size=1, max_size=50)
+        )
+    ),
+    min_size=1,
+    max_size=5
+)
+SENSITIVE_DICT_LIST_STRATEGY = st.lists(
+    st.dictionaries(
+        keys=st.sampled_from(["api_key", "email", "normal"]),
+        values=st.text(min_size=1, max_size=30)
+    ),
+    min_size=1,
+    max_size=10
+)
+
+
 # Property 56: Sensitive data masking
 @pytest.mark.property
-@given(
-    api_key=st.text(min_size=16, max_size=64, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
-    key_name=st.sampled_from([
-        "api_key", "API_KEY", "auth_token", "AUTH-TOKEN",
-        "password", "PASSWORD", "secret", "SECRET",
-        "sendgrid_api_key", "twilio_auth_token", "openai_api_key"
-    ])
-)
-@settings(max_examples=100)
+@given(api_key=API_KEY_STRATEGY, key_name=SENSITIVE_KEY_NAME_STRATEGY)
 def test_property_56_sensitive_data_masking(api_key, key_name):
     """
     Feature: devsync-sales-ai, Property 56: Sensitive data masking
@@ -60,11 +87,7 @@ def test_property_56_sensitive_data_masking(api_key, key_name):
 
 
 @pytest.mark.property
-@given(
-    email=st.emails(),
-    phone=st.from_regex(r"\+91[6-9]\d{9}", fullmatch=True)
-)
-@settings(max_examples=100)
+@given(email=st.emails(), phone=INDIAN_PHONE_STRATEGY)
 def test_property_56_pii_masking(email, phone):
     """
     Feature: devsync-sales-ai, Property 56: Sensitive data masking
@@ -98,23 +121,7 @@ def test_property_56_pii_masking(email, phone):
 
 
 @pytest.mark.property
-@given(
-    nested_data=st.dictionaries(
-        keys=st.sampled_from(["api_key", "normal_field", "password", "data"]),
-        values=st.one_of(
-            st.text(min_size=1, max_size=50),
-            st.integers(),
-            st.booleans(),
-            st.dictionaries(
-                keys=st.text(min_size=1, max_size=20),
-                values=st.text(min_size=1, max_size=50)
-            )
-        ),
-        min_size=1,
-        max_size=5
-    )
-)
-@settings(max_examples=50)
+@given(nested_data=SENSITIVE_DICT_STRATEGY)
 def test_property_56_nested_masking(nested_data):
     """
     Feature: devsync-sales-ai, Property 56: Sensitive data masking
@@ -140,17 +147,7 @@ def test_property_56_nested_masking(nested_data):
 
 
 @pytest.mark.property
-@given(
-    data_list=st.lists(
-        st.dictionaries(
-            keys=st.sampled_from(["api_key", "email", "normal"]),
-            values=st.text(min_size=1, max_size=30)
-        ),
-        min_size=1,
-        max_size=10
-    )
-)
-@settings(max_examples=50)
+@given(data_list=SENSITIVE_DICT_LIST_STRATEGY)
 def test_property_56_list_masking(data_list):
     """
     Feature: devsync-sales-ai, Property 56: Sensitive data masking
@@ -307,6 +304,63 @@ async def test_log_approval():
     )
 
 
+@pytest.mark.asyncio
+async def test_audit_rows_are_written_in_batches(monkeypatch):
+    """Test audit rows are buffered and written together on flush."""
+    written = []
+    monkeypatch.setattr(AuditLogger, "_write_rows", staticmethod(lambda rows: written.append(rows) or True))
+    audit = AuditLogger()
+    await audit.flush()
+    written.clear()
+    
+    for campaign_id in range(3):
+        await audit.log_campaign(
+            campaign_id=campaign_id,
+            campaign_type="email",
+            action="start",
+            details={}
+        )
+    
+    assert written == []
+    
+    await audit.flush()
+    
+    assert len(written) == 1
+    assert [row["details"]["campaign_id"] for row in written[0]] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_audit_write_is_requeued(monkeypatch):
+    """Test rows from a failed batch write are kept for the next flush."""
+    written = []
+    monkeypatch.setattr(AuditLogger, "_write_rows", staticmethod(lambda rows: written.append(rows) or True))
+    audit = AuditLogger()
+    await audit.flush()
+    written.clear()
+    
+    monkeypatch.setattr(AuditLogger, "_write_rows", staticmethod(lambda rows: False))
+    await audit.log_campaign(campaign_id=1, campaign_type="email", action="start", details={})
+    await audit.flush()
+    
+    monkeypatch.setattr(AuditLogger, "_write_rows", staticmethod(lambda rows: written.append(rows) or True))
+    await audit.flush()
+    
+    assert len(written) == 1
+    assert [row["details"]["campaign_id"] for row in written[0]] == [1]
+
+
+def test_audit_row_written_without_event_loop(monkeypatch):
+    """Test rows stored outside an event loop are written immediately."""
+    written = []
+    monkeypatch.setattr(AuditLogger, "_write_rows", staticmethod(lambda rows: written.append(rows) or True))
+    audit = AuditLogger()
+    
+    audit._store(log_level="INFO", component="campaign", action="start", details={"campaign_id": 7})
+    
+    assert AuditLogger._pending == []
+    assert written[-1][-1]["details"] == {"campaign_id": 7}
+
+
 def test_email_masking_patterns():
     """Test various email masking patterns."""
     audit = AuditLogger()
@@ -343,6 +397,26 @@ def test_phone_masking_patterns():
             assert phone[-4:] in masked
 
 
+def test_bare_phone_masking_matches_inline():
+    """Bare phone values mask the same way as phones inside text."""
+    audit = AuditLogger()
+    
+    for phone in ["+919876543210", "919876543210", "+1234567890", "9876543210"]:
+        inline = audit._mask_string(f"Phone: {phone}")
+        assert audit._mask_string(phone) == inline[len("Phone: "):]
+
+
+def test_flat_scalar_dict_is_returned_unchanged():
+    """Dicts with nothing to mask skip the walk; sensitive keys still mask."""
+    audit = AuditLogger()
+    
+    counters = {"total_attempted": 10, "total_success": 8, "total_failed": 2}
+    assert audit._mask_sensitive_data(counters) is counters
+    
+    assert audit._mask_sensitive_data({"password": 1234}) == {"password": "****"}
+    assert audit._mask_sensitive_data({"email": "john@example.com"})["email"] != "john@example.com"
+
+
 def test_nested_dict_masking():
     """Test masking in deeply nested dictionaries."""
     audit = AuditLogger()
@@ -3,15 +3,14 @@
 Feature: devsync-sales-ai
 """
 
+import functools
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume
+from sqlalchemy import bindparam, text
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 import tempfile
 import os
 
-from app.db import Base
 from app.models import (
     Lead, VerificationResult, OutreachHistory, OptOut,
     ApprovalQueue, Campaign, AuditLog
@@ -20,18 +19,43 @@ from app.models import (
 
 # Test database setup
 @pytest.fixture(scope="function")
-def test_db_session():
-    """Create a test database session."""
-    # Use in-memory SQLite for testing
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    
-    yield session
-    
-    session.close()
-    Base.metadata.drop_all(engine)
+def test_db_session(db_session):
+    """Create a test database session.
+    
+    Uses the shared in-memory database, whose schema is created once per
+    session; commits only release savepoints and are rolled back afterwards.
+    """
+    return db_session
+
+
+def per_example_savepoint(test):
+    """Roll back each Hypothesis example's writes before the next one runs.
+    
+    Examples share one function-scoped session, so without this rows from
+    earlier examples (and their unique values) leak into later ones.
+    """
+    @functools.wraps(test)
+    def wrapper(test_db_session, **kwargs):
+        savepoint = test_db_session.bind.begin_nested()
+        try:
+            return test(test_db_session, **kwargs)
+        finally:
+            # End the session's own savepoint first; it nests inside ours
+            test_db_session.rollback()
+            test_db_session.expunge_all()
+            savepoint.rollback()
+    return wrapper
+
+
+# Lead columns checked by the round-trip property, in SELECT order
+LEAD_ROUND_TRIP_COLUMNS = (
+    "source", "business_name", "city", "category", "website",
+    "primary_email", "primary_phone", "email_verified", "phone_verified",
+    "verification_confidence", "opted_out", "contact_count",
+)
+LEAD_ROUND_TRIP_QUERY = text(
+    f"SELECT id, {', '.join(LEAD_ROUND_TRIP_COLUMNS)} FROM leads WHERE id IN :ids"
+).bindparams(bindparam("ids", expanding=True))
 
 
 # Hypothesis strategies for generating test data
@@ -56,9 +80,12 @@ def lead_strategy(draw):
 
 # Property 48: Lead storage round-trip
 @pytest.mark.property
-@given(lead_data=lead_strategy())
-@settings(max_examples=100)
-def test_property_48_lead_storage_round_trip(test_db_session, lead_data):
+@given(lead_data_list=st.lists(
+    lead_strategy(), min_size=20, max_size=20,
+    unique_by=lambda d: (d["business_name"], d["website"], d["primary_phone"])
+))
+@per_example_savepoint
+def test_property_48_lead_storage_round_trip(test_db_session, lead_data_list):
     """
     Feature: devsync-sales-ai, Property 48: Lead storage round-trip
     For any lead stored in the database, retrieving the lead by ID must return
@@ -66,40 +93,39 @@ def test_property_48_lead_storage_round_trip(test_db_session, lead_data):
     
     Validates: Requirements 15.2
     """
-    # Create lead
-    lead = Lead(**lead_data)
-    test_db_session.add(lead)
+    # Create leads in one bulk INSERT; each example covers 20 rows
+    leads = [Lead(**lead_data) for lead_data in lead_data_list]
+    test_db_session.bulk_save_objects(leads, return_defaults=True)
     test_db_session.commit()
-    test_db_session.refresh(lead)
     
-    lead_id = lead.id
+    lead_ids = [lead.id for lead in leads]
     
     # Clear session to ensure we're reading from database
     test_db_session.expunge_all()
     
-    # Retrieve lead
-    retrieved_lead = test_db_session.query(Lead).filter(Lead.id == lead_id).first()
-    
-    # Verify all fields match
-    assert retrieved_lead is not None
-    assert retrieved_lead.id == lead_id
-    assert retrieved_lead.source == lead_data["source"]
-    assert retrieved_lead.business_name == lead_data["business_name"]
-    assert retrieved_lead.city == lead_data["city"]
-    assert retrieved_lead.category == lead_data["category"]
-    assert retrieved_lead.website == lead_data["website"]
-    assert retrieved_lead.primary_email == lead_data["primary_email"]
-    assert retrieved_lead.primary_phone == lead_data["primary_phone"]
-    assert retrieved_lead.email_verified == lead_data["email_verified"]
-    assert retrieved_lead.phone_verified == lead_data["phone_verified"]
-    assert retrieved_lead.opted_out == lead_data["opted_out"]
-    assert retrieved_lead.contact_count == lead_data["contact_count"]
-    
-    # Verify confidence score (handle floating point comparison)
-    if lead_data["verification_confidence"] is not None:
-        assert abs(retrieved_lead.verification_confidence - lead_data["verification_confidence"]) < 0.0001
-    else:
-        assert retrieved_lead.verification_confidence is None
+    # Retrieve leads as plain rows; the scalar comparisons below don't
+    # need the identity map or attribute instrumentation
+    rows = test_db_session.execute(
+        LEAD_ROUND_TRIP_QUERY, {"ids": lead_ids}
+    ).fetchall()
+    retrieved_by_id = {row[0]: row[1:] for row in rows}
+    
+    for lead_id, lead_data in zip(lead_ids, lead_data_list):
+        retrieved = retrieved_by_id.get(lead_id)
+        
+        # Verify all fields match (SQLite returns booleans as 0/1, which compare equal)
+        assert retrieved is not None
+        for column, value in zip(LEAD_ROUND_TRIP_COLUMNS, retrieved):
+            if column == "verification_confidence":
+                continue
+            assert value == lead_data[column], f"{column} must round-trip"
+        
+        # Verify confidence score (handle floating point comparison)
+        confidence = retrieved[LEAD_ROUND_TRIP_COLUMNS.index("verification_confidence")]
+        if lead_data["verification_confidence"] is not None:
+            assert abs(confidence - lead_data["verification_confidence"]) < 0.0001
+        else:
+            assert confidence is None
 
 
 # Property 49: Outreach history round-trip
@@ -110,7 +136,7 @@ def test_property_48_lead_storage_round_trip(test_db_session, lead_data):
     outcome=st.one_of(st.none(), st.sampled_from(["answered", "voicemail", "busy", "no-answer"])),
     duration=st.one_of(st.none(), st.integers(min_value=0, max_value=3600))
 )
-@settings(max_examples=100)
+@per_example_savepoint
 def test_property_49_outreach_history_round_trip(test_db_session, outreach_type, status, outcome, duration):
     """
     Feature: devsync-sales-ai, Property 49: Outreach history round-trip
@@ -173,7 +199,7 @@ def test_property_49_outreach_history_round_trip(test_db_session, outreach_type,
     contact_value=st.one_of(st.emails(), st.from_regex(r"\+91[6-9]\d{9}", fullmatch=True)),
     opt_out_method=st.sampled_from(["link", "email_reply", "call_request", "sms"])
 )
-@settings(max_examples=100)
+@per_example_savepoint
 def test_property_50_opt_out_permanence(test_db_session, contact_type, contact_value, opt_out_method):
     """
     Feature: devsync-sales-ai, Property 50: Opt-out permanence
@@ -0,0 +1,56 @@
+"""Tests for the shared HTTP client helpers."""
+
+import httpx
+import pytest
+
+from app import http_client
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Install a shared client backed by a scripted transport."""
+    responses = []
+    
+    def handler(request):
+        return responses.pop(0)
+    
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    
+    async def no_sleep(delay):
+        pass
+    
+    monkeypatch.setattr(http_client.asyncio, "sleep", no_sleep)
+    return responses
+
+
+@pytest.mark.asyncio
+async def test_get_with_retry_retries_transient_status(mock_client):
+    """Test 429/5xx responses are retried until a success."""
+    mock_client.extend([
+        httpx.Response(429, headers={"Retry-After": "1"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"ok": True}),
+    ])
+    
+    response = await http_client.get_with_retry("https://api.example.com/check")
+    
+    assert response.status_code == 200
+    assert http_client.parse_json(response) == {"ok": True}
+    assert mock_client == []
+
+
+@pytest.mark.asyncio
+async def test_get_with_retry_returns_last_response_when_exhausted(mock_client):
+    """Test the final failing response is returned after max attempts."""
+    mock_client.extend([httpx.Response(503), httpx.Response(503)])
+    
+    response = await http_client.get_with_retry("https://api.example.com/check", max_attempts=2)
+    
+    assert response.status_code == 503
+
+
+def test_retry_delay_is_capped():
+    """Test backoff delay honours Retry-After and never exceeds the cap."""
+    assert http_client._retry_delay(0, "2") == 2.0
+    assert http_client._retry_delay(10) == http_client.MAX_RETRY_DELAY
+    assert 1.0 <= http_client._retry_delay(0) < 2.0
@@ -3,6 +3,7 @@
 Feature: devsync-sales-ai
 """
 
+import asyncio
 import pytest
 from hypothesis import given, strategies as st, settings, assume
 from app.scraper.base import BaseScraper, ScrapeQuery, RawLead
@@ -369,3 +370,20 @@ async def test_linkedin_scraper_initialization():
     scraper = LinkedInCompanyScraper()
     assert scraper.source_name == "linkedin_company"
     assert scraper.base_url == "https://www.linkedin.com"
+
+
+async def test_host_semaphore_shared_per_host():
+    """Test requests to the same host share one semaphore."""
+    semaphore = BaseScraper.get_host_semaphore("www.justdial.com", 4)
+    
+    assert BaseScraper.get_host_semaphore("www.justdial.com", 4) is semaphore
+    assert BaseScraper.get_host_semaphore("www.linkedin.com", 2) is not semaphore
+    assert BaseScraper.get_host_semaphore("www.justdial.com", 2) is not semaphore
+
+
+def test_host_semaphore_per_event_loop():
+    """Test a new event loop never reuses an earlier loop's semaphore."""
+    async def get_semaphore():
+        return BaseScraper.get_host_semaphore("www.justdial.com", 4)
+    
+    assert asyncio.run(get_semaphore()) is not asyncio.run(get_semaphore())
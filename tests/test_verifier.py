@@ -3,10 +3,13 @@
 Feature: devsync-sales-ai
 """
 
+import asyncio
 import pytest
 from hypothesis import given, strategies as st, settings, assume
 from app.verifier.email_verify import EmailVerifier, EmailVerificationResult
 from app.verifier.phone_verify import PhoneVerifier, PhoneVerificationResult
+from app.verifier.cache import TTLCache
+from app.verifier import email_verify
 
 
 # Property 5: Email verification requirement
@@ -320,3 +323,95 @@ async def test_verification_result_structure():
     assert hasattr(result, 'provider_response')
     assert hasattr(result, 'provider_name')
     assert hasattr(result, 'verified_at')
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test verification cache stays bounded and evicts LRU entries."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    # Touch "a" so "b" becomes least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    """Test verification cache entries expire after their TTL."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("fresh", 1)
+    cache.set("stale", 2, ttl=0)
+    
+    assert cache.get("fresh") == 1
+    assert cache.get("stale") is None
+    assert "stale" not in cache
+
+
+@pytest.mark.asyncio
+async def test_verify_many_preserves_order():
+    """Test batch verification returns one result per input, in order."""
+    email_verifier = EmailVerifier()
+    emails = ["info@business.com", "john.doe@gmail.com", "info@business.com"]
+    
+    email_results = await email_verifier.verify_many(emails, concurrency=2)
+    assert [r.email for r in email_results] == emails
+    
+    phone_verifier = PhoneVerifier()
+    phones = ["+919876543210", "invalid"]
+    
+    phone_results = await phone_verifier.verify_many(phones, concurrency=2)
+    assert len(phone_results) == 2
+    assert phone_results[1].is_valid == False
+
+
+@pytest.mark.asyncio
+async def test_email_verifier_local_rejects():
+    """Test malformed and disposable addresses are rejected without a provider."""
+    verifier = EmailVerifier()
+    
+    for email in ["not-an-email", "sales@mailinator.com"]:
+        result = await verifier.verify(email)
+        assert result.is_deliverable == False
+        assert result.confidence_score == 0.0
+        assert result.provider_response["method"] == "local_reject"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_verifications_are_coalesced():
+    """Test simultaneous verifications of one address share a single lookup."""
+    verifier = EmailVerifier()
+    calls = 0
+    original = verifier._verify_uncached
+    
+    async def counting_verify_uncached(email, key):
+        nonlocal calls
+        calls += 1
+        return await original(email, key)
+    
+    verifier._verify_uncached = counting_verify_uncached
+    
+    results = await asyncio.gather(*(verifier.verify("info@business.com") for _ in range(5)))
+    
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_fields_round_trip():
+    """Test the compact shared-cache form keeps every field but provider_response."""
+    verifier = EmailVerifier()
+    result = await verifier.verify("info@business.com")
+    
+    restored = email_verify._from_cache_fields(email_verify._to_cache_fields(result))
+    
+    assert restored.email == result.email
+    assert restored.is_deliverable == result.is_deliverable
+    assert restored.is_business == result.is_business
+    assert restored.confidence_score == result.confidence_score
+    assert restored.verified_at == result.verified_at
+    assert restored.provider_response == {}